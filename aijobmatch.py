@@ -1,209 +1,2435 @@
-import fitz  # PyMuPDF for PDF parsing
 import os
-import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
 import re
+import sys
 import webbrowser
 import threading
 import json
 from datetime import datetime
 import time
 import urllib.parse
-import requests
-from bs4 import BeautifulSoup
+import sqlite3
+import hashlib
+import zlib
+import gzip
+import io
+import mmap
 import random
+import argparse
+import itertools
+import email.utils
+import queue
+import importlib
+import importlib.util
+import inspect
+import bisect
+import contextlib
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 
-class LinkedInJobScraper:
+class _LazyModule:
+    """
+    Defers importing a module until one of its attributes is first used
+    Keeps headless startup fast and lets the core logic run without tkinter
+    """
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+fitz = _LazyModule("fitz")  # PyMuPDF for PDF parsing
+requests = _LazyModule("requests")
+bs4 = _LazyModule("bs4")
+np = _LazyModule("numpy")
+zstd = _LazyModule("zstandard")
+scipy_sparse = _LazyModule("scipy.sparse")
+tk = _LazyModule("tkinter")
+ttk = _LazyModule("tkinter.ttk")
+filedialog = _LazyModule("tkinter.filedialog")
+messagebox = _LazyModule("tkinter.messagebox")
+
+logger = logging.getLogger("aijobmatch")
+
+class Metrics:
+    """
+    Thread-safe counters and latency histograms for each pipeline stage
+    Exported as JSON or the Prometheus text format so a slow run can be traced
+    to the network, throttling, parsing or rendering.
+    """
+    
+    # Upper bounds in seconds; values above the last bound only count towards +Inf
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    PREFIX = "jobmatch_"
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+    
+    def inc(self, name, value=1, **labels):
+        """Add `value` to a counter"""
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def observe(self, name, value, **labels):
+        """Record one measurement, usually a duration in seconds, in a histogram"""
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = {"count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * len(self.BUCKETS)}
+            hist["count"] += 1
+            hist["sum"] += value
+            hist["max"] = max(hist["max"], value)
+            index = bisect.bisect_left(self.BUCKETS, value)
+            if index < len(self.BUCKETS):
+                hist["buckets"][index] += 1
+    
+    @contextlib.contextmanager
+    def timer(self, name, **labels):
+        """Time the enclosed block into a histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def record_error(self, stage, error):
+        """Count and log an exception that a stage recovers from instead of raising"""
+        self.inc("errors_total", stage=stage)
+        logger.warning("%s failed: %s: %s", stage, type(error).__name__, error)
+    
+    def snapshot(self):
+        """Return every counter and histogram as plain data"""
+        with self.lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            histograms = []
+            for (name, labels), hist in sorted(self.histograms.items()):
+                cumulative, total = {}, 0
+                for bound, count in zip(self.BUCKETS, hist["buckets"]):
+                    total += count
+                    cumulative[str(bound)] = total
+                cumulative["+Inf"] = hist["count"]
+                histograms.append({
+                    "name": name, "labels": dict(labels), "count": hist["count"],
+                    "sum": hist["sum"], "max": hist["max"], "buckets": cumulative
+                })
+        return {"counters": counters, "histograms": histograms}
+    
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+    
+    @staticmethod
+    def _labels(labels, **extra):
+        labels = dict(labels, **extra)
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+    
+    def to_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+        typed = set()
+        for counter in snapshot["counters"]:
+            name = self.PREFIX + counter["name"]
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{self._labels(counter['labels'])} {counter['value']}")
+        for hist in snapshot["histograms"]:
+            name = self.PREFIX + hist["name"]
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            for bound, count in hist["buckets"].items():
+                lines.append(f"{name}_bucket{self._labels(hist['labels'], le=bound)} {count}")
+            lines.append(f"{name}_sum{self._labels(hist['labels'])} {hist['sum']}")
+            lines.append(f"{name}_count{self._labels(hist['labels'])} {hist['count']}")
+        return "\n".join(lines) + "\n"
+    
+    def summary(self):
+        """Human-readable table of stage totals, slowest stages first"""
+        snapshot = self.snapshot()
+        lines = [f"{'Stage':<34}{'Count':>8}{'Total s':>10}{'Mean ms':>10}{'Max ms':>10}"]
+        for hist in sorted(snapshot["histograms"], key=lambda h: h["sum"], reverse=True):
+            label = hist["name"] + self._labels(hist["labels"])
+            mean = hist["sum"] / hist["count"] * 1000 if hist["count"] else 0.0
+            lines.append(f"{label:<34}{hist['count']:>8}{hist['sum']:>10.2f}{mean:>10.1f}{hist['max'] * 1000:>10.1f}")
+        lines.append("")
+        lines.append(f"{'Counter':<44}{'Value':>18}")
+        for counter in snapshot["counters"]:
+            label = counter["name"] + self._labels(counter["labels"])
+            lines.append(f"{label:<44}{counter['value']:>18,}")
+        return "\n".join(lines)
+    
+    def write(self, path):
+        """Write the metrics to a file: Prometheus text for .prom/.txt, JSON otherwise"""
+        text = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+# Process-wide registry shared by every stage
+metrics = Metrics()
+
+class SearchDeadlineExceeded(Exception):
+    """Raised into a running search once its deadline has passed, so the source stops paging"""
+
+class TokenBucket:
+    """
+    A thread-safe token bucket
+    Refills at `rate` tokens per second and holds at most `capacity` tokens
+    """
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, cancel=None):
+        """
+        Block until a token is available, then consume it
+        
+        Raises:
+            SearchDeadlineExceeded: If the `cancel` event is set before a token is taken
+        """
+        while True:
+            if cancel is not None and cancel.is_set():
+                raise SearchDeadlineExceeded()
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            if cancel is not None:
+                cancel.wait(wait)
+            else:
+                time.sleep(wait)
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def set_rate(self, rate):
+        """Change the refill rate, crediting tokens earned at the old rate first"""
+        with self.lock:
+            self._refill()
+            self.rate = rate
+    
+    def pause(self, seconds):
+        """Hold back every acquire for at least `seconds` (e.g. from a Retry-After header)"""
+        with self.lock:
+            self._refill()
+            # A token debt delays the next acquire by the pause plus one refill interval
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+class HostRateLimiter:
+    """
+    Per-host rate limiter shared by every scraper and worker thread
+    Keeps one token bucket per host so concurrent queries stay within the same politeness budget.
+    Each host's rate adapts AIMD-style: it grows additively towards `max_requests_per_second`
+    while responses succeed and halves on 429/5xx responses, which may also pause the host.
+    """
+    
+    def __init__(self, requests_per_second=0.5, burst=1, max_requests_per_second=None):
+        self.requests_per_second = requests_per_second
+        self.max_requests_per_second = max_requests_per_second
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+    
+    def _bucket(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.requests_per_second, self.burst)
+                self.buckets[host] = bucket
+        return bucket
+    
+    def acquire(self, url, cancel=None):
+        """Block until a request to the host of `url` is allowed or the `cancel` event is set"""
+        with metrics.timer("rate_limit_wait_seconds"):
+            self._bucket(url).acquire(cancel)
+    
+    def record(self, url, status_code, retry_after=None):
+        """
+        Adapt the host's rate to a response
+        
+        Args:
+            url (str): The requested URL
+            status_code (int): HTTP status of the response
+            retry_after (float): Seconds from a Retry-After header, if any
+        """
+        bucket = self._bucket(url)
+        ceiling = self.max_requests_per_second or self.requests_per_second
+        if status_code == 429 or status_code >= 500:
+            bucket.set_rate(max(self.requests_per_second / 16, bucket.rate / 2))
+            if retry_after:
+                bucket.pause(retry_after)
+        elif status_code < 400 and bucket.rate < ceiling:
+            bucket.set_rate(min(ceiling, bucket.rate + self.requests_per_second / 10))
+
+def parse_retry_after(value):
+    """Convert a Retry-After header (seconds or HTTP date) to seconds, or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def is_transient_status(status_code):
+    return status_code == 429 or status_code >= 500
+
+class CachedResponse:
+    """Minimal stand-in for a requests response, served from the ResponseCache"""
+    
+    def __init__(self, status_code, text, headers=None, from_cache=False):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.from_cache = from_cache
+
+class ResponseCache:
+    """
+    A persistent, TTL-aware HTTP response cache backed by SQLite
+    Entries are keyed by normalized URL and evicted least-recently-used once
+    the cache holds more than `max_entries` responses
+    """
+    
+    def __init__(self, path, ttl=3600, max_entries=5000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                "stored_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+    
+    @staticmethod
+    def normalize_url(url):
+        """Lower-case scheme and host, sort query parameters and drop the fragment"""
+        parts = urllib.parse.urlsplit(url)
+        query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)))
+        return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+    
+    def get(self, url):
+        """
+        Look up a cached response
+        
+        Returns:
+            tuple: (entry, fresh) where entry is a dict with body, etag and last_modified,
+                   or (None, False) when the URL is not cached
+        """
+        key = self.normalize_url(url)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, False
+            
+            fresh = now - row[3] < self.ttl
+            if fresh:
+                self.hits += 1
+                with self.conn:
+                    self.conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, key))
+            else:
+                self.misses += 1
+        
+        return {"body": row[0], "etag": row[1], "last_modified": row[2]}, fresh
+    
+    def put(self, url, body, headers=None):
+        """Store a response body and its validators, evicting the least recently used entries"""
+        headers = headers or {}
+        key = self.normalize_url(url)
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, stored_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, headers.get("ETag"), headers.get("Last-Modified"), now, now)
+            )
+            excess = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.conn.execute(
+                    "DELETE FROM responses WHERE url IN "
+                    "(SELECT url FROM responses ORDER BY last_access ASC LIMIT ?)", (excess,)
+                )
+    
+    def refresh(self, url):
+        """Mark a stale entry as fresh again after a successful conditional revalidation"""
+        key = self.normalize_url(url)
+        now = time.time()
+        with self.lock, self.conn:
+            self.revalidations += 1
+            self.conn.execute("UPDATE responses SET stored_at = ?, last_access = ? WHERE url = ?", (now, now, key))
+    
+    def stats(self):
+        """Return hit/miss counters and the number of stored entries"""
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations, "entries": entries}
+    
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM responses")
+
+def cached_get(session, url, headers, cache=None, rate_limiter=None, timeout=10, cancel=None):
+    """
+    GET a URL through the response cache
+    
+    Fresh cache entries are returned without touching the network. Stale entries are
+    revalidated with If-None-Match / If-Modified-Since when the server sent validators.
+    
+    Returns:
+        requests.Response or CachedResponse
+    """
+    entry = None
+    request_headers = headers
+    if cache is not None:
+        entry, fresh = cache.get(url)
+        metrics.inc("cache_hits_total" if fresh else "cache_misses_total")
+        if fresh:
+            return CachedResponse(200, entry["body"], from_cache=True)
+        if entry and (entry["etag"] or entry["last_modified"]):
+            request_headers = dict(headers)
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+    
+    if rate_limiter is not None:
+        rate_limiter.acquire(url, cancel)
+    with metrics.timer("http_request_seconds"):
+        response = session.get(url, headers=request_headers, timeout=timeout)
+    metrics.inc("http_responses_total", status=response.status_code)
+    metrics.inc("http_bytes_downloaded_total", len(response.content))
+    if rate_limiter is not None:
+        rate_limiter.record(url, response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+    
+    if cache is not None:
+        if response.status_code == 304 and entry:
+            cache.refresh(url)
+            metrics.inc("cache_revalidated_total")
+            return CachedResponse(200, entry["body"], from_cache=True)
+        if response.status_code == 200:
+            cache.put(url, response.text, response.headers)
+    
+    return response
+
+def fetch_with_retry(session, url, headers, cache=None, rate_limiter=None, max_retries=3, backoff=1.0, timeout=10,
+                     cancel=None):
+    """
+    GET a URL through the response cache, retrying transient failures
+    
+    429/5xx responses and connection errors are retried up to `max_retries` times
+    with full-jitter exponential backoff, waiting at least as long as Retry-After asks.
+    Setting the `cancel` event interrupts rate-limit waits and backoff sleeps.
+    
+    Returns:
+        requests.Response or CachedResponse: The last response received
+    
+    Raises:
+        requests.RequestException: If the last attempt failed without a response
+        SearchDeadlineExceeded: If `cancel` is set while waiting
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            response = cached_get(
+                session, url, headers, cache=cache, rate_limiter=rate_limiter, timeout=timeout, cancel=cancel
+            )
+        except requests.RequestException as e:
+            if attempt == max_retries:
+                raise
+            metrics.record_error("http_request", e)
+            delay = random.uniform(0, backoff * 2 ** attempt)
+        else:
+            if not is_transient_status(response.status_code) or attempt == max_retries:
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After")) or 0.0
+            delay = max(retry_after, random.uniform(0, backoff * 2 ** attempt))
+        
+        metrics.inc("http_retries_total")
+        metrics.observe("retry_backoff_seconds", delay)
+        if cancel is None:
+            time.sleep(delay)
+        elif cancel.wait(delay):
+            raise SearchDeadlineExceeded()
+
+class Job:
+    """
+    Compact job record
+    Fields live in __slots__ instead of a per-job dict, repeated strings such as
+    keywords, companies and locations are interned, and the scrape time is kept as
+    integer epoch seconds. Supports the dict-style access the rest of the app uses
+    and only becomes a real dict at the UI/export boundary through to_dict.
+    """
+    
+    __slots__ = ("job_id", "title", "company", "location", "url", "date_posted", "scraped_at",
+                 "keyword", "description", "keywords", "duplicate_ids")
+    
+    FIELDS = ("job_id", "title", "company", "location", "url", "date_posted", "scrape_time",
+              "keyword", "description", "keywords", "duplicate_ids")
+    # Fields left out of the mapping view while they are None
+    OPTIONAL_FIELDS = frozenset(("keyword", "description", "keywords", "duplicate_ids"))
+    
+    def __init__(self, job_id="", title="", company="", location="", url="", date_posted="",
+                 scrape_time=None, keyword=None, description=None, keywords=None, duplicate_ids=None):
+        # Loaded files may hold nulls; every interned field falls back to ""
+        self.job_id = sys.intern(job_id or "")
+        self.title = sys.intern(title or "")
+        self.company = sys.intern(company or "")
+        self.location = sys.intern(location or "")
+        self.url = url or ""
+        self.date_posted = sys.intern(date_posted or "")
+        self.scraped_at = self._timestamp(scrape_time)
+        self.keyword = sys.intern(keyword) if keyword else keyword
+        self.description = description
+        self.keywords = keywords
+        self.duplicate_ids = duplicate_ids
+    
+    @staticmethod
+    def _timestamp(value):
+        if value is None:
+            return int(time.time())
+        if isinstance(value, str):
+            return int(datetime.fromisoformat(value).timestamp())
+        return int(value)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a job dictionary, ignoring keys that are not job fields"""
+        return cls(**{key: data[key] for key in cls.FIELDS if key in data})
+    
+    def __getitem__(self, key):
+        if key == "scrape_time":
+            return datetime.fromtimestamp(self.scraped_at).isoformat()
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None and key in self.OPTIONAL_FIELDS:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        if key == "scrape_time":
+            self.scraped_at = self._timestamp(value)
+        elif key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+    
+    def __contains__(self, key):
+        return key in self.FIELDS and (key not in self.OPTIONAL_FIELDS or getattr(self, key) is not None)
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __repr__(self):
+        return f"Job({self.job_id!r}, {self.title!r}, {self.company!r})"
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def keys(self):
+        return [key for key in self.FIELDS if key in self]
+    
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+    
+    def copy(self):
+        """Return an independent record; merged keyword and duplicate lists are copied too"""
+        job = Job.__new__(Job)
+        for slot in self.__slots__:
+            value = getattr(self, slot)
+            setattr(job, slot, list(value) if isinstance(value, list) else value)
+        return job
+    
+    def to_dict(self, **extra):
+        """Return the job as a plain dictionary, with any extra keys appended"""
+        data = dict(self.items())
+        data.update(extra)
+        return data
+
+RESULTS_ARCHIVE_DIR = os.path.join(os.path.expanduser("~"), ".jobmatch_runs")
+
+def _open_job_file(path, mode):
+    """Open a JSON Lines job file in binary mode, compressed according to its extension"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    if path.endswith(".zst"):
+        if importlib.util.find_spec("zstandard") is None:
+            raise RuntimeError("Reading and writing .zst files needs the optional zstandard package")
+        f = open(path, mode)
+        if "r" in mode:
+            return io.BufferedReader(zstd.ZstdDecompressor().stream_reader(f, read_across_frames=True, closefd=True))
+        return zstd.ZstdCompressor().stream_writer(f, closefd=True)
+    return open(path, mode)
+
+class JobExporter:
+    """
+    Streams jobs to a JSON Lines file, optionally gzip or zstd compressed
+    The file is opened in append mode and flushed after every batch, so a run can
+    be archived while the search is still going and an interrupted run keeps
+    everything written so far.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.file = _open_job_file(path, "ab")
+        self.count = 0
+        self.lock = threading.Lock()
+    
+    def write(self, jobs, scores=None):
+        """
+        Append jobs, one JSON object per line
+        
+        Args:
+            jobs (iterable): Job records or dictionaries
+            scores (iterable): Optional match scores, stored as "score" on each line
+        """
+        if scores is None:
+            lines = [json.dumps(job.to_dict() if isinstance(job, Job) else job) for job in jobs]
+        else:
+            lines = [json.dumps(dict(job, score=round(score, 4))) for job, score in zip(jobs, scores)]
+        if not lines:
+            return
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with self.lock:
+            self.file.write(data)
+            self.file.flush()
+            self.count += len(lines)
+    
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def export_jobs(path, ranked_jobs, batch_size=1000):
+    """Write (job, score) pairs to a new JSON Lines file in batches and return the number written"""
+    if os.path.exists(path):
+        os.remove(path)
+    exporter = JobExporter(path)
+    try:
+        batch = []
+        for pair in ranked_jobs:
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                exporter.write(*zip(*batch))
+                batch = []
+        if batch:
+            exporter.write(*zip(*batch))
+    finally:
+        exporter.close()
+    return exporter.count
+
+def iter_job_file(path):
+    """
+    Stream Job records back from an exported results file
+    Plain JSON Lines files are memory-mapped and compressed ones are decompressed
+    as a stream, so large archives never have to fit in memory as one document.
+    Files saved as a single JSON array by older versions are also accepted.
+    
+    Yields:
+        Job: One record per line; a saved "score" is dropped since scores are recomputed
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            for data in json.load(f):
+                yield Job.from_dict(data)
+        return
+    
+    if path.endswith((".gz", ".zst")):
+        with _open_job_file(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield Job.from_dict(json.loads(line))
+        return
+    
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield Job.from_dict(json.loads(line))
+
+class JobStore:
+    """
+    A persistent local job store backed by SQLite
+    Jobs are indexed by ID, search keyword, location and posting date, and titles,
+    companies and descriptions are full-text searchable when SQLite has FTS5
+    """
+    
+    COLUMNS = ("job_id", "title", "company", "location", "url", "date_posted", "scrape_time", "description")
+    
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, title TEXT, company TEXT, location TEXT, url TEXT, "
+                "date_posted TEXT, scrape_time TEXT, description TEXT)"
+            )
+            # Which (keyword, location) queries returned each job
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_queries ("
+                "job_id TEXT NOT NULL, keyword TEXT NOT NULL, location TEXT NOT NULL, "
+                "PRIMARY KEY (job_id, keyword, location))"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS queries ("
+                "keyword TEXT NOT NULL, location TEXT NOT NULL, last_run REAL NOT NULL, "
+                "PRIMARY KEY (keyword, location))"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_job_queries_query ON job_queries (keyword, location)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs (date_posted)")
+        
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(job_id UNINDEXED, title, company, description)"
+                )
+                # Full-text rows share the rowid of their jobs row, so updates never scan
+                # the FTS table; stores written before that are reindexed once
+                if self.conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+                    self.conn.execute("DELETE FROM jobs_fts")
+                    self.conn.execute(
+                        "INSERT INTO jobs_fts (rowid, job_id, title, company, description) "
+                        "SELECT rowid, job_id, title, company, COALESCE(description, '') FROM jobs"
+                    )
+                    self.conn.execute("PRAGMA user_version = 1")
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+    
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+    
+    def add(self, jobs, location=""):
+        """
+        Insert or update jobs, linking them to the queries that returned them
+        
+        Args:
+            jobs (list): Job dictionaries
+            location (str): The location the jobs were searched for
+        """
+        with self.lock, self.conn:
+            for job in jobs:
+                if not job.get("job_id"):
+                    continue
+                if self.has_fts:
+                    # INSERT OR REPLACE gives the job a new rowid; drop the old FTS row first
+                    row = self.conn.execute("SELECT rowid FROM jobs WHERE job_id = ?", (job["job_id"],)).fetchone()
+                    if row is not None:
+                        self.conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", row)
+                cursor = self.conn.execute(
+                    "INSERT OR REPLACE INTO jobs (job_id, title, company, location, url, date_posted, scrape_time, description) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, (SELECT description FROM jobs WHERE job_id = ?)))",
+                    (job["job_id"], job["title"], job["company"], job["location"], job["url"],
+                     job["date_posted"], job["scrape_time"], job.get("description"), job["job_id"])
+                )
+                for keyword in job.get("keywords") or [job["keyword"]]:
+                    self.conn.execute(
+                        "INSERT OR IGNORE INTO job_queries (job_id, keyword, location) VALUES (?, ?, ?)",
+                        (job["job_id"], keyword, location)
+                    )
+                if self.has_fts:
+                    self.conn.execute(
+                        "INSERT INTO jobs_fts (rowid, job_id, title, company, description) "
+                        "SELECT rowid, job_id, title, company, COALESCE(description, '') FROM jobs WHERE rowid = ?",
+                        (cursor.lastrowid,)
+                    )
+    
+    def descriptions(self, job_ids):
+        """Return {job_id: description} for the stored jobs that have a description"""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return {}
+        placeholders = ",".join("?" * len(job_ids))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT job_id, description FROM jobs WHERE job_id IN ({placeholders}) AND description != ''",
+                job_ids
+            ).fetchall()
+        return dict(rows)
+    
+    def set_description(self, job_id, description):
+        """Store a fetched description for a job that is already stored"""
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT rowid FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            self.conn.execute("UPDATE jobs SET description = ? WHERE rowid = ?", (description, row[0]))
+            if self.has_fts:
+                self.conn.execute("UPDATE jobs_fts SET description = ? WHERE rowid = ?", (description, row[0]))
+    
+    def known_ids(self, job_ids, keywords, location):
+        """Return the subset of job IDs already returned by a search for one of the keywords in this location"""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids or not keywords:
+            return set()
+        id_placeholders = ",".join("?" * len(job_ids))
+        keyword_placeholders = ",".join("?" * len(keywords))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT DISTINCT job_id FROM job_queries WHERE job_id IN ({id_placeholders}) "
+                f"AND keyword IN ({keyword_placeholders}) AND location = ?",
+                [*job_ids, *keywords, location]
+            ).fetchall()
+        return {row[0] for row in rows}
+    
+    def has_query(self, keyword, location):
+        """True if this (keyword, location) query has been searched before"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM queries WHERE keyword = ? AND location = ?", (keyword, location)
+            ).fetchone()
+        return row is not None
+    
+    def record_query(self, keyword, location):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO queries (keyword, location, last_run) VALUES (?, ?, ?)",
+                (keyword, location, time.time())
+            )
+    
+    def stored_queries(self):
+        """Return every (keyword, location) query searched so far, least recently run first"""
+        with self.lock:
+            return self.conn.execute("SELECT keyword, location FROM queries ORDER BY last_run").fetchall()
+    
+    def query(self, keyword=None, location=None, text=None, limit=None):
+        """
+        Return stored jobs, newest postings first
+        
+        Args:
+            keyword (str): Only jobs returned by searches for this keyword
+            location (str): Only jobs returned by searches in this location (used with keyword)
+            text (str): Full-text query over title, company and description
+            limit (int): Maximum number of jobs to return
+            
+        Returns:
+            list: Job dictionaries
+        """
+        sql = f"SELECT {', '.join('j.' + c for c in self.COLUMNS)}, q.keyword FROM jobs j JOIN job_queries q ON q.job_id = j.job_id"
+        conditions = []
+        params = []
+        if keyword is not None:
+            conditions.append("q.keyword = ?")
+            params.append(keyword)
+            if location is not None:
+                conditions.append("q.location = ?")
+                params.append(location)
+        if text:
+            if self.has_fts:
+                conditions.append("j.rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+                params.append(text)
+            else:
+                conditions.append("(j.title LIKE ? OR j.company LIKE ? OR j.description LIKE ?)")
+                params.extend([f"%{text}%"] * 3)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " GROUP BY j.job_id ORDER BY j.date_posted DESC, j.scrape_time DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        
+        jobs = []
+        for row in rows:
+            jobs.append(Job(keyword=row[-1], **dict(zip(self.COLUMNS, row[:-1]))))
+        return jobs
+
+class JobCardParser:
+    """
+    Parses LinkedIn search result pages into Job records
+    Only the <li> card subtrees are built and every field of a card is collected
+    in a single pass over its elements. The backend is selectolax or lxml when
+    installed, BeautifulSoup otherwise; all backends produce the same records.
+    """
+    
+    BACKENDS = ("selectolax", "lxml", "bs4")
+    JOB_ID_PATTERNS = (
+        re.compile(r'urn:li:jobPosting:(\d+)'),
+        re.compile(r'(?:jobs|view)/(?:[^/?#]*-)?(\d+)')
+    )
+    
+    def __init__(self, backend="auto"):
+        if backend == "auto":
+            backend = next(b for b in self.BACKENDS if b == "bs4" or importlib.util.find_spec(b) is not None)
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown parser backend: {backend}")
+        self.backend = backend
+        self._parse_cards = getattr(self, f"_parse_{backend}")
+    
+    # Field order of the compact rows returned by parse_rows
+    ROW_FIELDS = ("job_id", "title", "company", "location", "url", "date_posted")
+    
+    def parse(self, html, keyword):
+        """
+        Parse one result page
+        
+        Args:
+            html (str): The page HTML
+            keyword (str): The search keyword, recorded on every job
+            
+        Returns:
+            tuple: (jobs, card_count) where card_count includes cards that could not be parsed
+        """
+        rows, card_count = self.parse_rows(html)
+        return self.jobs_from_rows(rows, keyword), card_count
+    
+    def parse_rows(self, html):
+        """
+        Parse one result page into compact tuples ordered as ROW_FIELDS
+        
+        Returns:
+            tuple: (rows, card_count)
+        """
+        rows = []
+        card_count = 0
+        for fields in self._parse_cards(html):
+            card_count += 1
+            if fields.get("url") is not None:
+                rows.append(self._make_row(fields))
+        return rows, card_count
+    
+    @classmethod
+    def jobs_from_rows(cls, rows, keyword):
+        """Expand compact rows into Job records"""
+        scrape_time = int(time.time())
+        return [Job(*row, scrape_time=scrape_time, keyword=keyword) for row in rows]
+    
+    @classmethod
+    def _make_row(cls, fields):
+        job_url = fields["url"]
+        
+        # Find job ID
+        job_id = fields.get("data_id") or ""
+        if not job_id:
+            for pattern in cls.JOB_ID_PATTERNS:
+                match = pattern.search(fields.get("urn") or "") or pattern.search(job_url)
+                if match:
+                    job_id = match.group(1)
+                    break
+        
+        return (
+            job_id,
+            fields["title"],
+            fields.get("company") or "Unknown company",
+            fields.get("location") or "Unknown location",
+            job_url if job_url.startswith("http") else f"https://www.linkedin.com{job_url}",
+            fields.get("listdate", fields.get("date", ""))
+        )
+    
+    @staticmethod
+    def _collect(fields, tag, classes, get_attr, get_text):
+        """Record the card field an element holds, keeping the first match of each"""
+        if tag == "a":
+            if "base-card__full-link" in classes and "url" not in fields:
+                fields["url"] = get_attr("href") or ""
+                fields["title"] = get_text()
+        elif tag == "h4":
+            if "base-search-card__subtitle" in classes and "company" not in fields:
+                fields["company"] = get_text()
+        elif tag == "span":
+            if "job-search-card__location" in classes and "location" not in fields:
+                fields["location"] = get_text()
+        elif tag == "time":
+            if "job-search-card__listdate" in classes and "listdate" not in fields:
+                fields["listdate"] = get_attr("datetime") or ""
+            elif "date" not in fields:
+                fields["date"] = get_attr("datetime") or ""
+        elif tag == "div" and "urn" not in fields:
+            urn = get_attr("data-entity-urn")
+            if urn:
+                fields["urn"] = urn
+    
+    def _parse_bs4(self, html):
+        features = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+        soup = bs4.BeautifulSoup(html, features, parse_only=bs4.SoupStrainer("li"))
+        for card in soup.find_all("li"):
+            fields = {"data_id": card.get("data-id")}
+            for elem in card.descendants:
+                if elem.name is not None:
+                    self._collect(
+                        fields, elem.name, elem.get("class") or (), elem.get,
+                        lambda elem=elem: elem.get_text().strip()
+                    )
+            yield fields
+    
+    def _parse_lxml(self, html):
+        lxml_html = importlib.import_module("lxml.html")
+        if not html.strip():
+            return
+        root = lxml_html.fromstring(html)
+        for card in root.iter("li"):
+            fields = {"data_id": card.get("data-id")}
+            for elem in card.iterdescendants():
+                if isinstance(elem.tag, str):
+                    self._collect(
+                        fields, elem.tag, (elem.get("class") or "").split(), elem.get,
+                        lambda elem=elem: elem.text_content().strip()
+                    )
+            yield fields
+    
+    def _parse_selectolax(self, html):
+        try:
+            tree = importlib.import_module("selectolax.lexbor").LexborHTMLParser(html)
+        except ImportError:
+            # selectolax < 1.0 only ships the Modest backend
+            tree = importlib.import_module("selectolax.parser").HTMLParser(html)
+        for card in tree.css("li"):
+            fields = {"data_id": card.attributes.get("data-id")}
+            for elem in card.traverse(include_text=False):
+                if elem is card:
+                    continue
+                attributes = elem.attributes
+                self._collect(
+                    fields, elem.tag, (attributes.get("class") or "").split(), attributes.get,
+                    lambda elem=elem: elem.text(deep=True).strip()
+                )
+            yield fields
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive"
+}
+
+def create_http_session(pool_maxsize=16):
+    """Return a requests session with a connection pool sized for the concurrent search workers"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+JOB_SOURCES = {}
+
+def register_source(cls):
+    """Class decorator making a JobSource available to the GUI, batch mode and query planner"""
+    JOB_SOURCES[cls.name] = cls
+    return cls
+
+def create_sources(names=None, **kwargs):
+    """
+    Instantiate registered sources
+    
+    Args:
+        names (list): Source names, defaults to every registered source
+        **kwargs: Constructor arguments; each source only receives those it accepts,
+                  or all of them if its constructor takes **kwargs
+        
+    Returns:
+        dict: name -> JobSource
+    """
+    sources = {}
+    for name in names or JOB_SOURCES:
+        cls = JOB_SOURCES[name]
+        parameters = inspect.signature(cls.__init__).parameters
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+            sources[name] = cls(**kwargs)
+        else:
+            sources[name] = cls(**{key: value for key, value in kwargs.items() if key in parameters})
+    return sources
+
+class JobSource(ABC):
+    """
+    Base class of the job boards a search fans out to
+    Subclasses set `name`, implement search_jobs and register with @register_source.
+    Every source created for a search shares one pooled HTTP session, the per-host
+    rate limiter and the response cache.
+    """
+    
+    name = None
+    # Whether keywords may be boolean OR expressions built by the QueryPlanner
+    supports_boolean = False
+    
+    def __init__(self, delay_between_requests=1.5, rate_limiter=None, cache=None, session=None, max_retries=3, backoff=1.0,
+                 **kwargs):
+        # create_sources hands **kwargs sources every option, including ones meant for
+        # other sources (job_store, parser, cpu_pool), so unknown options are ignored here
+        self.delay = delay_between_requests
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff = backoff
+        # Without a shared limiter, fall back to one request per `delay` seconds per host
+        self.rate_limiter = rate_limiter or HostRateLimiter(requests_per_second=1.0 / delay_between_requests)
+        self.session = session or create_http_session()
+        self.headers = dict(DEFAULT_HEADERS)
+    
+    @abstractmethod
+    def search_jobs(self, keyword, location="", max_jobs=10, on_page=None, incremental=False, cancel=None):
+        """
+        Search the source for one keyword and location
+        
+        on_page receives each batch of jobs as soon as it is parsed and may raise
+        SearchDeadlineExceeded, after which the source should return what it has.
+        The same happens when the `cancel` event is set while a request waits for
+        the rate limiter or a retry, so passing it on to _fetch_page is enough.
+        
+        Returns:
+            list: Job records
+        """
+    
+    def _fetch_page(self, url, cancel=None):
+        """Fetch a page, retrying throttled and failed requests with backoff"""
+        return fetch_with_retry(
+            self.session, url, self.headers, cache=self.cache, rate_limiter=self.rate_limiter,
+            max_retries=self.max_retries, backoff=self.backoff, cancel=cancel
+        )
+
+@register_source
+class LinkedInJobScraper(JobSource):
     """
     A class to scrape job listings from LinkedIn
     Handles pagination and detailed job information
     """
     
-    def __init__(self, delay_between_requests=1.5):
-        self.delay = delay_between_requests
-        self.session = requests.Session()
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
+    name = "LinkedIn"
+    supports_boolean = True
+    # The guest search API returns at most 25 cards per page
+    PAGE_SIZE = 25
+    
+    def __init__(self, delay_between_requests=1.5, rate_limiter=None, cache=None, job_store=None, max_retries=3,
+                 parser=None, cpu_pool=None, base_url="https://www.linkedin.com", backoff=1.0, session=None):
+        super().__init__(
+            delay_between_requests=delay_between_requests, rate_limiter=rate_limiter, cache=cache, session=session,
+            max_retries=max_retries, backoff=backoff
+        )
+        # Overridable so benchmarks can point the scraper at a local stand-in server
+        self.base_url = base_url.rstrip("/")
+        self.parser = parser or JobCardParser()
+        self.cpu_pool = cpu_pool
+        self.job_store = job_store
+        self.headers.update({
             "Referer": "https://www.linkedin.com/",
-            "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
             "Sec-Fetch-Mode": "navigate",
             "Sec-Fetch-Site": "same-origin",
             "Sec-Fetch-User": "?1",
             "Cache-Control": "max-age=0"
+        })
+        
+    def search_jobs(self, keyword, location="", max_jobs=10, job_type="", experience_level="", on_page=None,
+                    incremental=False, cancel=None):
+        """
+        Search for jobs with the given keyword and parameters
+        
+        Args:
+            keyword (str): The keyword to search for
+            location (str): Optional location filter
+            max_jobs (int): Maximum number of jobs to return
+            job_type (str): Optional job type filter (e.g., "F", "C", "P", "T", "I" for full-time, contract, etc.)
+            experience_level (str): Optional experience level filter
+            on_page (callable): Optional callback receiving the jobs of each page as soon as it is parsed
+            incremental (bool): Search newest postings first and stop at the first one already in the job store
+            cancel (threading.Event): Optional event that stops the search, even while it waits to fetch a page
+            
+        Returns:
+            list: A list of Job records with details
+        """
+        all_jobs = []
+        page = 0
+        
+        # Encode parameters for URL
+        keyword_encoded = urllib.parse.quote(keyword)
+        location_encoded = urllib.parse.quote(location) if location else ""
+        
+        # Build filter string
+        filters = []
+        if job_type:
+            filters.append(f"f_JT={job_type}")
+        if experience_level:
+            filters.append(f"f_E={experience_level}")
+        
+        filter_string = "&".join(filters)
+        if filter_string:
+            filter_string = "&" + filter_string
+        
+        # Location parameter
+        location_param = f"&location={location_encoded}" if location else ""
+        
+        # Incremental refreshes sort by date so already stored postings end the scan; a
+        # query that never ran before has nothing stored to stop at and is searched in full
+        incremental = incremental and self.job_store is not None and self.job_store.has_query(keyword, location)
+        if incremental:
+            filter_string += "&sortBy=DD"
+        
+        def page_url(page):
+            # Calculate start parameter for pagination (25 results per page)
+            start = page * self.PAGE_SIZE
+            return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={keyword_encoded}{location_param}&start={start}{filter_string}"
+        
+        # One background fetch keeps the next page downloading while the current one is parsed
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        next_page = prefetcher.submit(self._fetch_page, page_url(page), cancel)
+        
+        try:
+            while len(all_jobs) < max_jobs:
+                try:
+                    response = next_page.result()
+                    next_page = None
+                    
+                    if response.status_code != 200:
+                        break
+                    
+                    # Prefetch when a full page of results would still leave us short of max_jobs
+                    if len(all_jobs) + self.PAGE_SIZE < max_jobs:
+                        next_page = prefetcher.submit(self._fetch_page, page_url(page + 1), cancel)
+                    
+                    # Only the job card subtrees are parsed, each in a single pass
+                    page_jobs, card_count = self._parse_page(response, keyword)
+                    
+                    if not card_count:
+                        break
+                    
+                    # Stop if we've reached the maximum number of jobs
+                    page_jobs = page_jobs[:max_jobs - len(all_jobs)]
+                    
+                    reached_known = False
+                    if incremental:
+                        # Jobs from combined OR queries are stored under the individual skills
+                        known = self.job_store.known_ids(
+                            [job["job_id"] for job in page_jobs], QueryPlanner.skills_of(keyword), location
+                        )
+                        for index, job in enumerate(page_jobs):
+                            if job["job_id"] in known:
+                                page_jobs = page_jobs[:index]
+                                reached_known = True
+                                break
+                    
+                    all_jobs.extend(page_jobs)
+                    if on_page and page_jobs:
+                        on_page(page_jobs)
+                    
+                    # A short page is the last one
+                    if reached_known or card_count < self.PAGE_SIZE:
+                        break
+                    
+                    # Move to next page
+                    page += 1
+                    if next_page is None and len(all_jobs) < max_jobs:
+                        next_page = prefetcher.submit(self._fetch_page, page_url(page), cancel)
+                    
+                except SearchDeadlineExceeded:
+                    break
+                except Exception as e:
+                    metrics.record_error("search_page", e)
+                    break
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            prefetcher.shutdown(wait=False)
+        
+        return all_jobs[:max_jobs]
+    
+    def _parse_page(self, response, keyword):
+        """Parse a result page in the CPU worker pool when there is one"""
+        with metrics.timer("parse_page_seconds"):
+            jobs, card_count = None, 0
+            if self.cpu_pool is not None:
+                try:
+                    jobs, card_count = self.cpu_pool.parse_page(response, keyword)
+                except BrokenProcessPool as e:
+                    metrics.record_error("cpu_pool", e)
+                    self.cpu_pool = None
+            if jobs is None:
+                jobs, card_count = self.parser.parse(response.text, keyword)
+        metrics.inc("cards_parsed_total", len(jobs))
+        metrics.inc("cards_dropped_total", card_count - len(jobs))
+        return jobs, card_count
+
+class JobDetailFetcher:
+    """
+    Fetches LinkedIn job detail pages concurrently with bounded parallelism
+    Requests go through the scraper's session, per-host rate limiter and response
+    cache, and each job ID is fetched at most once. With a job store, stored
+    descriptions are reused and fetched ones are written back.
+    """
+    
+    DETAIL_URL = "{base_url}/jobs-guest/jobs/api/jobPosting/{job_id}"
+    
+    def __init__(self, scraper, max_workers=4, job_store=None):
+        self.scraper = scraper
+        self.max_workers = max_workers
+        self.job_store = job_store
+        self.descriptions = {}
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def parse_description(html):
+        """Extract the plain-text description from a job detail page"""
+        soup = bs4.BeautifulSoup(html, 'html.parser')
+        elem = soup.find("div", class_="show-more-less-html__markup") or soup.find("div", class_="description__text")
+        return elem.get_text(" ", strip=True) if elem else ""
+    
+    def _fetch_description(self, job_id):
+        url = self.DETAIL_URL.format(base_url=self.scraper.base_url, job_id=job_id)
+        try:
+            response = self.scraper._fetch_page(url)
+            if response.status_code != 200:
+                return ""
+            return self.parse_description(response.text)
+        except Exception as e:
+            metrics.record_error("job_detail", e)
+            return ""
+    
+    def fetch(self, jobs):
+        """
+        Fill in the "description" of each job, streaming jobs back as they complete
+        
+        Jobs that already have a description, or whose ID was already fetched or
+        is stored with one, are yielded first without a request; jobs without a
+        LinkedIn ID are yielded with an empty description.
+        
+        Args:
+            jobs (list): Job dictionaries from search_jobs
+            
+        Yields:
+            tuple: (job, description)
+        """
+        jobs = list(jobs)
+        stored = {}
+        if self.job_store is not None:
+            stored = self.job_store.descriptions([job.get("job_id", "") for job in jobs if not job.get("description")])
+        
+        pending = {}
+        for job in jobs:
+            job_id = job.get("job_id", "")
+            with self.lock:
+                known = job.get("description") or stored.get(job_id) or self.descriptions.get(job_id)
+            if known is not None or not job_id.isdigit():
+                job["description"] = known or ""
+                yield job, job["description"]
+            else:
+                pending.setdefault(job_id, []).append(job)
+        
+        if not pending:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+            futures = {pool.submit(self._fetch_description, job_id): job_id for job_id in pending}
+            for future in as_completed(futures):
+                job_id = futures[future]
+                description = future.result()
+                with self.lock:
+                    self.descriptions[job_id] = description
+                if self.job_store is not None and description:
+                    self.job_store.set_description(job_id, description)
+                for job in pending[job_id]:
+                    job["description"] = description
+                    yield job, description
+
+@register_source
+class IndeedJobScraper(JobSource):
+    """
+    A class to scrape job listings from Indeed
+    (Simplified version for demonstration)
+    """
+    
+    name = "Indeed"
+    
+    def search_jobs(self, keyword, location="", max_jobs=10, on_page=None, incremental=False, cancel=None):
+        """Basic Indeed job search (placeholder implementation)"""
+        all_jobs = []
+        
+        # For demo purposes, return a fallback link
+        job = Job(
+            keyword=keyword,
+            job_id="indeed-fallback",
+            title=f"Search {keyword} jobs on Indeed",
+            company="Indeed",
+            location=location if location else "Various locations",
+            url=f"https://www.indeed.com/jobs?q={urllib.parse.quote(keyword)}&l={urllib.parse.quote(location) if location else ''}"
+        )
+        all_jobs.append(job)
+        if on_page:
+            on_page(all_jobs)
+        
+        return all_jobs
+
+class ConcurrentSearchExecutor:
+    """
+    Fans out (source, keyword, location) job queries over a bounded thread pool
+    Politeness is enforced by the scrapers' shared HostRateLimiter, so total latency
+    is bounded by the rate budget rather than by summed per-page sleeps. Sources are
+    interleaved and an optional deadline stops slow ones, so a throttled source
+    cannot hold the whole search hostage.
+    """
+    
+    def __init__(self, scrapers, max_workers=8, planner=None):
+        self.scrapers = scrapers
+        self.max_workers = max_workers
+        # Attributes jobs from combined OR queries back to individual skills
+        self.planner = planner
+        # Whether the deadline of the last run cut any query short
+        self.deadline_exceeded = False
+    
+    def build_queries(self, keywords, locations, sources):
+        """Return every (source, keyword, location) combination to search"""
+        return [(source, kw, loc) for kw in keywords for loc in locations for source in sources]
+    
+    def run(self, queries, max_jobs=10, on_page=None, incremental=False, limits=None, deadline=None):
+        """
+        Run all queries concurrently
+        
+        Args:
+            queries (list): (source, keyword, location) tuples from build_queries or QueryPlanner.plan
+            max_jobs (int): Maximum number of jobs per query
+            on_page (callable): Optional callback receiving (query, jobs) for every parsed page,
+                                called from worker threads
+            incremental (bool): Only fetch postings newer than those in the scrapers' job store
+            limits (dict): Optional per-query job limits overriding max_jobs
+            deadline (float): Optional time budget in seconds. Queries still running when it
+                              expires are cancelled, stop waiting for the rate limiter or a
+                              retry, and are yielded with the jobs they had delivered so far
+            
+        Yields:
+            tuple: ((source, keyword, location), jobs) as each query completes
+        """
+        self.deadline_exceeded = False
+        if not queries:
+            return
+        limits = limits or {}
+        attribute = self.planner.attribute if self.planner is not None else (lambda jobs: jobs)
+        expires = time.monotonic() + deadline if deadline is not None else None
+        # Set at the deadline or when the caller stops early, so no search outlives the run
+        cancel = threading.Event()
+        partial = {query: [] for query in queries}
+        
+        def page_callback(query):
+            def callback(jobs):
+                # Pages arriving after the deadline are dropped and end the source's search
+                if expires is not None and time.monotonic() >= expires:
+                    raise SearchDeadlineExceeded()
+                jobs = attribute(jobs)
+                partial[query].extend(jobs)
+                if on_page is not None:
+                    on_page(query, jobs)
+            return callback
+        
+        # Round-robin over sources so one slow source cannot take every worker first
+        by_source = {}
+        for query in queries:
+            by_source.setdefault(query[0], []).append(query)
+        ordered = [query for round_ in itertools.zip_longest(*by_source.values()) for query in round_ if query is not None]
+        
+        def result(future):
+            try:
+                return attribute(future.result())
+            except SearchDeadlineExceeded:
+                return list(partial[futures[future]])
+            except Exception as e:
+                metrics.record_error("search_query", e)
+                return []
+        
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries)))
+        futures = {
+            pool.submit(
+                self.scrapers[source].search_jobs, kw, location=loc, max_jobs=limits.get((source, kw, loc), max_jobs),
+                on_page=page_callback((source, kw, loc)), incremental=incremental, cancel=cancel
+            ): (source, kw, loc)
+            for source, kw, loc in ordered
+        }
+        pending = set(futures)
+        try:
+            timeout = None if expires is None else max(0.0, expires - time.monotonic())
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                yield futures[future], result(future)
+        except FuturesTimeoutError:
+            self.deadline_exceeded = True
+            cancel.set()
+            for future in pending:
+                query = futures[future]
+                if future.done():
+                    yield query, result(future)
+                    continue
+                future.cancel()
+                metrics.inc("search_deadline_exceeded_total", source=query[0])
+                yield query, list(partial[query])
+        finally:
+            # Searches still running stop at their next wait or page; never block on them here
+            cancel.set()
+            pool.shutdown(wait=False)
+
+class QueryPlanner:
+    """
+    Batches related skills into combined OR searches
+    Skills of one taxonomy category share a query while it stays within the keyword
+    length limit, and every returned job is attributed back to the skills it
+    mentions by local matching. Skills outside the taxonomy keep their own query.
+    """
+    
+    TERM_PATTERN = re.compile(r'"([^"]+)"')
+    
+    def __init__(self, skill_matcher, max_query_length=120, max_skills_per_query=5, page_size=LinkedInJobScraper.PAGE_SIZE):
+        self.skill_matcher = skill_matcher
+        self.max_query_length = max_query_length
+        self.max_skills_per_query = max_skills_per_query
+        self.page_size = page_size
+    
+    @staticmethod
+    def expression(skills):
+        """Return the keyword expression searching for any of the skills"""
+        return " OR ".join(f'"{skill}"' for skill in skills)
+    
+    @classmethod
+    def skills_of(cls, keyword):
+        """Return the skills a planned keyword searches for"""
+        terms = cls.TERM_PATTERN.findall(keyword)
+        return terms if terms and " OR " in keyword else [keyword]
+    
+    def group(self, skills):
+        """Split skills into lists that each fit in one query"""
+        groups = []
+        by_category = {}
+        for skill in skills:
+            category = self.skill_matcher.categories.get(skill)
+            if category is None or '"' in skill:
+                groups.append([skill])
+            else:
+                by_category.setdefault(category, []).append(skill)
+        
+        for members in by_category.values():
+            current = []
+            for skill in members:
+                candidate = current + [skill]
+                if current and (len(candidate) > self.max_skills_per_query
+                                or len(self.expression(candidate)) > self.max_query_length):
+                    groups.append(current)
+                    candidate = [skill]
+                current = candidate
+            groups.append(current)
+        return groups
+    
+    def plan(self, skills, locations, sources, max_jobs):
+        """
+        Plan the searches for a set of skills
+        
+        A combined query may return up to max_jobs for each of its skills, which
+        usually still fits in the pages a single-skill query would fetch.
+        
+        Args:
+            skills (list): Canonical skill names to search for
+            locations (list): Locations to search
+            sources (list): Job sources to search
+            max_jobs (int): Maximum number of jobs per skill
+            
+        Returns:
+            tuple: (queries, limits, report) where limits maps each query to its job limit
+                   and report compares the query and estimated request counts with one
+                   query per skill
+        """
+        groups = self.group(skills)
+        queries = []
+        limits = {}
+        for source in sources:
+            # Only sources that understand boolean keyword expressions get combined queries
+            boolean = source in JOB_SOURCES and JOB_SOURCES[source].supports_boolean
+            source_groups = groups if boolean else [[skill] for skill in skills]
+            for group in source_groups:
+                keyword = group[0] if len(group) == 1 else self.expression(group)
+                for location in locations:
+                    query = (source, keyword, location)
+                    queries.append(query)
+                    limits[query] = max_jobs * len(group)
+        
+        pages = lambda count: -(-count // self.page_size)
+        naive_queries = len(skills) * len(locations) * len(sources)
+        naive_requests = naive_queries * pages(max_jobs)
+        planned_requests = sum(pages(limit) for limit in limits.values())
+        report = {
+            "naive_queries": naive_queries,
+            "planned_queries": len(queries),
+            "naive_requests": naive_requests,
+            "planned_requests": planned_requests,
+            "requests_saved": naive_requests - planned_requests
         }
+        metrics.inc("planner_requests_saved_total", max(0, report["requests_saved"]))
+        return queries, limits, report
+    
+    def attribute(self, jobs):
+        """
+        Point jobs returned by a combined query at the skills they mention
+        "keyword" becomes the first matching skill and "keywords" all of them. A job
+        that mentions none of the query's skills in the text we have (the search
+        matched its description) is filed under every skill of the query but keeps
+        the combined query as its "keyword", so the ranker does not count those
+        unconfirmed skills as mentions.
+        """
+        for job in jobs:
+            skills = self.skills_of(job.get("keyword") or "")
+            if len(skills) < 2:
+                continue
+            found = self.skill_matcher.extract(f"{job['title']} {job.get('description', '')}")
+            matched = [skill for skill in skills if skill in found]
+            if matched:
+                job["keyword"] = matched[0]
+            job["keywords"] = matched or skills
+        return jobs
+    
+    @classmethod
+    def confirmed_keywords(cls, job):
+        """Return the search keywords a job counts as mentioning; none for a combined-query fallback"""
+        if len(cls.skills_of(job.get("keyword") or "")) > 1:
+            return []
+        return [keyword for keyword in job.get("keywords") or [job.get("keyword")] if keyword]
+
+PDF_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".jobmatch_pdf_cache")
+
+def file_sha256(path):
+    """Hash a file's content in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _extract_page_range(path, start, stop):
+    """Extract the text of pages [start, stop) of a PDF (runs in worker processes)"""
+    doc = fitz.open(path)
+    try:
+        return [doc[index].get_text() for index in range(start, stop)]
+    finally:
+        doc.close()
+
+class PdfTextExtractor:
+    """
+    Streams PDF text page by page
+    Extracted pages are cached on disk keyed by the file's content hash, and
+    documents with at least `parallel_threshold` pages are split into page
+    ranges across a process pool. The cache keeps the `max_entries` most recently
+    used documents.
+    """
+    
+    def __init__(self, cache_dir=PDF_CACHE_DIR, parallel_threshold=32, max_workers=None, executor=None,
+                 max_entries=50):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor
+    
+    def _cache_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def _load_cached(self, digest):
+        path = self._cache_path(digest)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                pages = json.load(f)
+            # Mark the entry as recently used so eviction keeps it
+            os.utime(path)
+            return pages
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached(self, digest, pages):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._cache_path(digest) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(pages, f)
+            os.replace(tmp_path, self._cache_path(digest))
+            self._evict()
+        except OSError:
+            pass
+    
+    def _evict(self):
+        """Delete the least recently used documents beyond max_entries"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _iter_parallel(self, path, page_count):
+        # A few ranges per worker keeps the pool busy while pages still arrive in order
+        chunk = max(1, -(-page_count // (self.max_workers * 4)))
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+        
+        executor = self.executor or ProcessPoolExecutor(max_workers=min(self.max_workers, len(ranges)))
+        futures = [executor.submit(_extract_page_range, path, start, stop) for start, stop in ranges]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Drop pending ranges if the consumer stopped early
+            for future in futures:
+                future.cancel()
+            if executor is not self.executor:
+                executor.shutdown()
+    
+    def iter_pages(self, path):
+        """
+        Yield the text of each page in order
+        
+        Args:
+            path (str): Path to the PDF file
+            
+        Yields:
+            str: The text of one page
+        """
+        digest = file_sha256(path)
+        cached = self._load_cached(digest)
+        if cached is not None:
+            yield from cached
+            return
+        
+        pages = []
+        doc = fitz.open(path)
+        try:
+            page_count = doc.page_count
+            if page_count < self.parallel_threshold or self.max_workers < 2:
+                for page in doc:
+                    text = page.get_text()
+                    pages.append(text)
+                    yield text
+        finally:
+            doc.close()
+        
+        if len(pages) < page_count:
+            for text in self._iter_parallel(path, page_count):
+                pages.append(text)
+                yield text
+        
+        self._store_cached(digest, pages)
+    
+    def extract_text(self, path):
+        """Return the whole document text, pages joined by newlines"""
+        return "\n".join(self.iter_pages(path))
+
+SKILL_TAXONOMY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills_taxonomy.json")
+
+class SkillMatcher:
+    """
+    A precompiled multi-pattern matcher for skill taxonomies
+    Builds an Aho-Corasick automaton over every canonical name and alias once, so
+    extraction runs in time linear in the text length regardless of taxonomy size
+    """
+    
+    # A "requires_context" term must lie within this many characters of another skill
+    CONTEXT_WINDOW = 40
+    # Words that turn a following single letter into a grade or label ("Grade C", "Type R")
+    LETTER_PREFIXES = {"grade", "class", "type", "level", "tier", "plan", "section", "part", "vitamin", "series"}
+    
+    def __init__(self, skills):
+        """
+        Args:
+            skills (list): Taxonomy entries with "name" and optional "aliases",
+                           "exact_aliases", "category", "case_sensitive" and
+                           "requires_context" keys
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        # Each output is (term length, canonical name, exact spelling or None, requires context)
+        self.outputs = [[]]
+        self.categories = {}
+        
+        for skill in skills:
+            name = skill["name"]
+            self.categories[name] = skill.get("category", "")
+            # Ambiguous names such as "Go" or "R" only match with their exact spelling,
+            # and everyday words such as "Swift" or "Flask" only next to another skill
+            self._add_term(
+                name, name, name if skill.get("case_sensitive", False) else None,
+                skill.get("requires_context", False)
+            )
+            for term in skill.get("aliases", []):
+                self._add_term(term, name, None)
+            for term in skill.get("exact_aliases", []):
+                self._add_term(term, name, term)
+        
+        self._build_failure_links()
+    
+    @classmethod
+    def from_file(cls, path):
+        """Load a JSON skill taxonomy file"""
+        with open(path, "r", encoding="utf-8") as f:
+            taxonomy = json.load(f)
+        return cls(taxonomy["skills"])
+    
+    @staticmethod
+    def _normalize_char(ch):
+        if ch.isspace():
+            return " "
+        lowered = ch.lower()
+        return lowered if len(lowered) == 1 else ch
+    
+    def _add_term(self, term, canonical, exact, requires_context=False):
+        normalized = " ".join(term.split())
+        state = 0
+        for ch in normalized:
+            ch = self._normalize_char(ch)
+            next_state = self.goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][ch] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append(
+            (len(normalized), canonical, " ".join(exact.split()) if exact else None, requires_context)
+        )
+    
+    def _build_failure_links(self):
+        # Breadth-first, so every failure target is complete before it is inherited from
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+    
+    @staticmethod
+    def _is_word_char(ch):
+        return ch.isalnum() or ch == "_"
+    
+    def _is_letter_grade(self, text, start, end):
+        """True for "R&D", "C-level" or "Grade C", where a single letter is not a language"""
+        if end < len(text) and text[end] in "&-":
+            return True
+        preceding = text[max(0, start - 12):start].split()
+        return bool(preceding) and preceding[-1].lower() in self.LETTER_PREFIXES
+    
+    def find(self, text):
+        """
+        Find every skill mention in the text
+        
+        Overlapping mentions are resolved leftmost-longest, so "Ruby on Rails" wins
+        over "Ruby" and "SQL Server" over "SQL".
         
-    def search_jobs(self, keyword, location="", max_jobs=10, job_type="", experience_level=""):
+        Returns:
+            list: (canonical name, start, end) tuples ordered by position
         """
-        Search for jobs with the given keyword and parameters
+        # Runs of whitespace are fed to the automaton as a single space;
+        # fed_positions maps automaton input back to offsets in the original text
+        fed_positions = []
+        candidates = []
+        state = 0
+        previous_space = False
         
-        Args:
-            keyword (str): The keyword to search for
-            location (str): Optional location filter
-            max_jobs (int): Maximum number of jobs to return
-            job_type (str): Optional job type filter (e.g., "F", "C", "P", "T", "I" for full-time, contract, etc.)
-            experience_level (str): Optional experience level filter
+        for index, ch in enumerate(text):
+            ch = self._normalize_char(ch)
+            if ch == " ":
+                if previous_space:
+                    continue
+                previous_space = True
+            else:
+                previous_space = False
+            fed_positions.append(index)
+            
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
             
+            for length, canonical, exact, requires_context in self.outputs[state]:
+                start = fed_positions[-length]
+                end = index + 1
+                if start > 0 and self._is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and self._is_word_char(text[end]):
+                    continue
+                if exact is not None and " ".join(text[start:end].split()) != exact:
+                    continue
+                if length == 1 and self._is_letter_grade(text, start, end):
+                    continue
+                candidates.append((start, end, canonical, requires_context))
+        
+        resolved = []
+        last_end = -1
+        for candidate in sorted(candidates, key=lambda c: (c[0], -c[1])):
+            if candidate[0] >= last_end:
+                resolved.append(candidate)
+                last_end = candidate[1]
+        
+        # "Swift delivery" or "Flask of water" are only skills when listed among others.
+        # Resolved matches do not overlap, so the nearest anchor on each side is found
+        # with one backward pass for the next anchor start and one forward pass
+        next_anchor_starts = []
+        next_start = None
+        for start, end, _, requires_context in reversed(resolved):
+            next_anchor_starts.append(next_start)
+            if not requires_context:
+                next_start = start
+        next_anchor_starts.reverse()
+        
+        matches = []
+        previous_end = None
+        for (start, end, canonical, requires_context), next_start in zip(resolved, next_anchor_starts):
+            if not requires_context:
+                previous_end = end
+            elif not (
+                (previous_end is not None and start - previous_end <= self.CONTEXT_WINDOW)
+                or (next_start is not None and next_start - end <= self.CONTEXT_WINDOW)
+            ):
+                continue
+            matches.append((canonical, start, end))
+        return matches
+    
+    def extract(self, text):
+        """
+        Extract skills with match counts and positions
+        
         Returns:
-            list: A list of job dictionaries with details
+            dict: canonical name -> {"count": int, "positions": [start offsets]}
         """
-        all_jobs = []
-        page = 0
+        skills = {}
+        for canonical, start, end in self.find(text):
+            entry = skills.setdefault(canonical, {"count": 0, "positions": []})
+            entry["count"] += 1
+            entry["positions"].append(start)
+        return skills
+
+_skill_matchers = {}
+
+def load_skill_matcher(path=SKILL_TAXONOMY_FILE):
+    """Return the SkillMatcher for a taxonomy file, building it only once per process"""
+    matcher = _skill_matchers.get(path)
+    if matcher is None:
+        matcher = SkillMatcher.from_file(path)
+        _skill_matchers[path] = matcher
+    return matcher
+
+_cpu_worker_state = {}
+
+def _init_cpu_worker(taxonomy_file, parser_backend):
+    """Build the skill matcher and card parser once per worker process"""
+    _cpu_worker_state["matcher"] = load_skill_matcher(taxonomy_file)
+    _cpu_worker_state["parser"] = JobCardParser(parser_backend)
+
+def _parse_page_rows(content, encoding):
+    """Decode and parse a raw result page in a worker process"""
+    return _cpu_worker_state["parser"].parse_rows(content.decode(encoding, errors="replace"))
+
+def _count_skills(texts):
+    """Return {skill: count} for each text, computed in a worker process"""
+    matcher = _cpu_worker_state["matcher"]
+    return [{name: entry["count"] for name, entry in matcher.extract(text).items()} for text in texts]
+
+class CpuWorkerPool:
+    """
+    Runs CPU-bound stages in a process pool so they scale with cores and never hold
+    the GIL that the Tk main loop and the network threads need
+    Only raw page bytes and texts go in, and only compact tuples and counts come back.
+    Callers fall back to in-process work if the pool breaks.
+    """
+    
+    def __init__(self, max_workers=None, taxonomy_file=SKILL_TAXONOMY_FILE, parser_backend="auto"):
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_cpu_worker, initargs=(taxonomy_file, parser_backend)
+        )
+    
+    def parse_page(self, response, keyword):
+        """
+        Parse a result page response in a worker
         
-        # Encode parameters for URL
-        keyword_encoded = urllib.parse.quote(keyword)
-        location_encoded = urllib.parse.quote(location) if location else ""
+        Returns:
+            tuple: (jobs, card_count) as JobCardParser.parse
+        """
+        content = getattr(response, "content", None)
+        if content is None:
+            content, encoding = response.text.encode("utf-8"), "utf-8"
+        else:
+            encoding = response.encoding or "utf-8"
+        rows, card_count = self.executor.submit(_parse_page_rows, content, encoding).result()
+        return JobCardParser.jobs_from_rows(rows, keyword), card_count
+    
+    def count_skills(self, texts):
+        """Return one {skill: count} dict per text"""
+        return self.executor.submit(_count_skills, list(texts)).result()
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+class JobIndex:
+    """
+    Deduplicates jobs returned by overlapping queries
+    Postings are merged by job ID, and reposts under a new ID are detected with
+    MinHash/LSH over the normalized title, then confirmed only when the company
+    and location match exactly. Merged records collect every search keyword that
+    returned them in "keywords".
+    """
+    
+    # Small enough that a * h + b never overflows uint64 in the vectorized signature
+    PRIME = (1 << 31) - 1
+    # Title words that tell otherwise identical postings apart ("Engineer II" vs "III")
+    DISTINCT_TITLE_WORDS = {
+        "i", "ii", "iii", "iv", "v", "senior", "sr", "junior", "jr", "lead", "principal", "staff",
+        "head", "intern", "internship", "graduate", "entry", "associate", "contract", "contractor",
+        "freelance", "temporary", "temp", "part", "full", "time", "remote", "hybrid", "onsite"
+    }
+    
+    def __init__(self, num_hashes=16, bands=4, threshold=0.9):
+        self.bands = bands
+        self.rows_per_band = num_hashes // bands
+        self.threshold = threshold
+        # Universal hash functions (a * x + b) mod p stand in for random permutations
+        rng = random.Random(0x5EED)
+        self.hash_params = [(rng.randrange(1, self.PRIME), rng.randrange(self.PRIME)) for _ in range(num_hashes)]
+        self.vectorized = importlib.util.find_spec("numpy") is not None
+        if self.vectorized:
+            self.hash_a = np.array([a for a, _ in self.hash_params], dtype=np.uint64)[:, None]
+            self.hash_b = np.array([b for _, b in self.hash_params], dtype=np.uint64)[:, None]
+        self.clear()
+    
+    def clear(self):
+        self.jobs = []
+        self.by_key = {}
+        # Per indexed job: (title shingles, title words, normalized company and location)
+        self.fingerprints = {}
+        self.buckets = {}
+        self.duplicates = 0
+    
+    def __len__(self):
+        return len(self.jobs)
+    
+    @staticmethod
+    def _key(job):
+        # Guest API job IDs identify a posting; URLs carry per-query tracking parameters
+        job_id = job.get("job_id", "")
+        return job_id if job_id.isdigit() else job.get("url", job_id)
+    
+    @staticmethod
+    def _normalize(text):
+        return " ".join(re.sub(r"[^\w+#]+", " ", text.lower()).split())
+    
+    @staticmethod
+    def _shingles(text):
+        return frozenset(zlib.crc32(text[i:i + 3].encode("utf-8")) for i in range(max(1, len(text) - 2)))
+    
+    def _signature(self, shingles):
+        if self.vectorized:
+            hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles)) % np.uint64(self.PRIME)
+            return tuple(((self.hash_a * hashes + self.hash_b) % np.uint64(self.PRIME)).min(axis=1).tolist())
+        prime = self.PRIME
+        hashes = [h % prime for h in shingles]
+        return tuple(min((a * h + b) % prime for h in hashes) for a, b in self.hash_params)
+    
+    def _band_keys(self, signature):
+        step = self.rows_per_band
+        return [(band, signature[band * step:(band + 1) * step]) for band in range(self.bands)]
+    
+    def _fingerprint(self, job):
+        title = self._normalize(job.get("title", ""))
+        place = (self._normalize(job.get("company", "")), self._normalize(job.get("location", "")))
+        return self._shingles(title), frozenset(title.split()), place
+    
+    def _find_near_duplicate(self, signature, fingerprint):
+        shingles, words, place = fingerprint
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        # Verify LSH candidates: same employer and place, near-identical title, and
+        # no seniority, level or contract word that only one of the titles has
+        for index in sorted(candidates):
+            other_shingles, other_words, other_place = self.fingerprints[index]
+            if other_place != place:
+                continue
+            if (words ^ other_words) & self.DISTINCT_TITLE_WORDS:
+                continue
+            if len(shingles & other_shingles) >= self.threshold * len(shingles | other_shingles):
+                return self.jobs[index]
+        return None
+    
+    def add(self, job):
+        """
+        Add a job, merging it into an existing record when it is a duplicate
         
-        # Build filter string
-        filters = []
-        if job_type:
-            filters.append(f"f_JT={job_type}")
-        if experience_level:
-            filters.append(f"f_E={experience_level}")
+        Returns:
+            tuple: (record, is_new, added_keywords) where record is the job kept in
+                   the index and added_keywords lists the keywords a duplicate
+                   contributed that the record did not have yet
+        """
+        keyword = job.get("keyword")
+        key = self._key(job)
+        record = self.by_key.get(key)
+        if record is job:
+            # The same record delivered again (a page, then the query's full result)
+            return record, False, []
         
-        filter_string = "&".join(filters)
-        if filter_string:
-            filter_string = "&" + filter_string
+        signature = None
+        if record is None and job.get("job_id", "").isdigit():
+            fingerprint = self._fingerprint(job)
+            signature = self._signature(fingerprint[0])
+            record = self._find_near_duplicate(signature, fingerprint)
+            if record is not None:
+                self.by_key[key] = record
+                record.setdefault("duplicate_ids", []).append(job["job_id"])
         
-        # Location parameter
-        location_param = f"&location={location_encoded}" if location else ""
+        if record is not None:
+            self.duplicates += 1
+            added = []
+            for kw in job.get("keywords") or [keyword]:
+                if kw and kw not in record["keywords"]:
+                    record["keywords"].append(kw)
+                    added.append(kw)
+            return record, False, added
         
-        while len(all_jobs) < max_jobs:
-            # Calculate start parameter for pagination (25 results per page)
-            start = page * 25
-            url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={keyword_encoded}{location_param}&start={start}{filter_string}"
+        # Records reloaded from an export keep the keywords merged when they were saved
+        job["keywords"] = job.get("keywords") or ([keyword] if keyword else [])
+        index = len(self.jobs)
+        self.jobs.append(job)
+        self.by_key[key] = job
+        if signature is not None:
+            self.fingerprints[index] = fingerprint
+            for band_key in self._band_keys(signature):
+                self.buckets.setdefault(band_key, []).append(index)
+        return job, True, list(job["keywords"])
+
+def ranking_available():
+    """Vectorized ranking needs the optional NumPy and SciPy packages"""
+    return importlib.util.find_spec("numpy") is not None and importlib.util.find_spec("scipy") is not None
+
+class JobRanker:
+    """
+    Ranks jobs against a CV's skills with vectorized BM25 scoring
+    Jobs are indexed incrementally into a sparse job x skill matrix built from
+    their titles and, when available, descriptions
+    """
+    
+    OFFLOAD_MIN_CHARS = 20000
+    
+    def __init__(self, skill_matcher, k1=1.2, b=0.75, cpu_pool=None):
+        self.skill_matcher = skill_matcher
+        self.cpu_pool = cpu_pool
+        self.k1 = k1
+        self.b = b
+        self.clear()
+    
+    def clear(self):
+        self.jobs = []
+        self.job_rows = {}
+        self.skill_columns = {}
+        # Sparse matrix entries in coordinate form, appended as jobs arrive
+        self.rows = []
+        self.columns = []
+        self.counts = []
+        self.lengths = []
+        self._matrix = None
+    
+    def add(self, jobs):
+        """Index jobs, counting skill mentions in their title and description"""
+        jobs = list(jobs)
+        texts = [f"{job['title']} {job.get('description', '')}" for job in jobs]
+        with metrics.timer("skill_match_seconds"):
+            skill_counts = self._count_skills(texts)
+        for job, text, counts in zip(jobs, texts, skill_counts):
+            row = len(self.jobs)
+            # Each search keyword that returned the job counts as one mention
+            for keyword in QueryPlanner.confirmed_keywords(job):
+                counts[keyword] = counts.get(keyword, 0) + 1
             
+            for skill, count in counts.items():
+                self._append(row, skill, count)
+            self.lengths.append(max(1, len(text.split())))
+            self.job_rows[id(job)] = row
+            self.jobs.append(job)
+        self._matrix = None
+    
+    def _count_skills(self, texts):
+        # Titles alone are cheaper to match here than to ship to another process
+        if self.cpu_pool is not None and sum(map(len, texts)) >= self.OFFLOAD_MIN_CHARS:
             try:
-                response = self.session.get(url, headers=self.headers, timeout=10)
-                
-                if response.status_code != 200:
-                    break
-                
-                # Use BeautifulSoup for more reliable HTML parsing
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all("li")
-                
-                if not job_cards:
-                    break
-                
-                # Process job cards on this page
-                for job_card in job_cards:
-                    # Extract job details
-                    job = self._extract_job_data(job_card, keyword)
-                    if job:
-                        all_jobs.append(job)
-                        
-                        # Stop if we've reached the maximum number of jobs
-                        if len(all_jobs) >= max_jobs:
-                            break
-                
-                # Random delay to avoid rate limiting
-                delay = self.delay + (random.random() * 0.5)
-                time.sleep(delay)
-                
-                # Move to next page
-                page += 1
-                
-            except Exception as e:
-                break
-        
-        return all_jobs[:max_jobs]
+                return self.cpu_pool.count_skills(texts)
+            except BrokenProcessPool as e:
+                metrics.record_error("cpu_pool", e)
+                self.cpu_pool = None
+        return [{name: entry["count"] for name, entry in self.skill_matcher.extract(text).items()} for text in texts]
     
-    def _extract_job_data(self, job_card, keyword):
-        """Extract job data from a job card element"""
-        try:
-            # Find the job link and title
-            job_link_elem = job_card.find("a", class_="base-card__full-link")
-            if not job_link_elem:
-                return None
-                
-            job_url = job_link_elem.get("href", "")
-            job_title = job_link_elem.get_text().strip()
-            
-            # Find company name
-            company_elem = job_card.find("h4", class_="base-search-card__subtitle")
-            company = company_elem.get_text().strip() if company_elem else "Unknown company"
-            
-            # Find location
-            location_elem = job_card.find("span", class_="job-search-card__location")
-            location = location_elem.get_text().strip() if location_elem else "Unknown location"
-            
-            # Find posting date
-            date_elem = job_card.find("time", class_="job-search-card__listdate")
-            if date_elem:
-                date = date_elem.get("datetime", "")
-            else:
-                # Try alternative date element
-                date_elem = job_card.find("time")
-                date = date_elem.get("datetime", "") if date_elem else ""
-            
-            # Find job ID
-            job_id = ""
-            data_id = job_card.get("data-id")
-            if data_id:
-                job_id = data_id
-            else:
-                # Try to extract from URL
-                match = re.search(r'(?:jobs|view)/(\d+)', job_url)
-                if match:
-                    job_id = match.group(1)
-            
-            # Create job dictionary
-            job = {
-                "keyword": keyword,
-                "job_id": job_id,
-                "title": job_title,
-                "company": company,
-                "location": location,
-                "url": job_url if job_url.startswith("http") else f"https://www.linkedin.com{job_url}",
-                "date_posted": date,
-                "scrape_time": datetime.now().isoformat()
-            }
-            
-            return job
+    def add_keyword(self, job, keyword):
+        """Count one more mention of a search keyword for a job that is already indexed"""
+        row = self.job_rows.get(id(job))
+        if row is not None:
+            self._append(row, keyword, 1)
+            self._matrix = None
+    
+    def _append(self, row, skill, count):
+        # Repeated (row, column) entries are summed when the matrix is built
+        column = self.skill_columns.setdefault(skill, len(self.skill_columns))
+        self.rows.append(row)
+        self.columns.append(column)
+        self.counts.append(count)
+    
+    def _build_matrix(self):
+        if self._matrix is None:
+            self._matrix = scipy_sparse.csc_matrix(
+                (np.array(self.counts, dtype=np.float64), (np.array(self.rows), np.array(self.columns))),
+                shape=(len(self.jobs), len(self.skill_columns))
+            )
+        return self._matrix
+    
+    def scores(self, cv_skills):
+        """
+        Score every indexed job against the CV skills
+        
+        Args:
+            cv_skills (list): Skill names extracted from the CV
             
-        except Exception as e:
-            return None
+        Returns:
+            numpy.ndarray: One BM25 score per indexed job, in indexing order
+        """
+        job_count = len(self.jobs)
+        query_columns = sorted({self.skill_columns[s] for s in cv_skills if s in self.skill_columns})
+        if not job_count or not query_columns:
+            return np.zeros(job_count)
+        
+        matrix = self._build_matrix()
+        document_frequency = np.diff(matrix.indptr)[query_columns]
+        idf = np.log(1.0 + (job_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        
+        lengths = np.array(self.lengths, dtype=np.float64)
+        norms = self.k1 * (1.0 - self.b + self.b * lengths / lengths.mean())
+        
+        query = matrix[:, query_columns].tocoo()
+        weights = query.data * (self.k1 + 1.0) / (query.data + norms[query.row]) * idf[query.col]
+        return np.bincount(query.row, weights=weights, minlength=job_count)
+    
+    def rank(self, cv_skills):
+        """
+        Return (job, score) pairs sorted by descending score
+        Ties keep scrape order; without NumPy/SciPy every job scores 0 in scrape order
+        """
+        if not ranking_available():
+            return [(job, 0.0) for job in self.jobs]
+        
+        scores = self.scores(cv_skills)
+        order = np.argsort(-scores, kind="stable")
+        return [(self.jobs[index], float(scores[index])) for index in order]
 
-class IndeedJobScraper:
+class ResultsView:
     """
-    A class to scrape job listings from Indeed
-    (Simplified version for demonstration)
+    Job results table backed by a ttk.Treeview
+    Rows are lightweight items rather than widgets and Tk only draws the visible
+    ones, so rows can be appended incrementally and sorted or filtered by
+    moving and detaching items without rebuilding anything
     """
     
-    def __init__(self, delay_between_requests=1.5):
-        self.delay = delay_between_requests
-        self.session = requests.Session()
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive"
-        }
+    COLUMNS = (
+        ("score", "Score", 70),
+        ("title", "Title", 320),
+        ("company", "Company", 170),
+        ("location", "Location", 160),
+        ("date_posted", "Posted", 90)
+    )
     
-    def search_jobs(self, keyword, location="", max_jobs=10):
-        """Basic Indeed job search (placeholder implementation)"""
-        all_jobs = []
+    def __init__(self, parent):
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(fill=tk.BOTH, expand=True)
         
-        # For demo purposes, return a fallback link
-        job = {
-            "keyword": keyword,
-            "job_id": "indeed-fallback",
-            "title": f"Search {keyword} jobs on Indeed",
-            "company": "Indeed",
-            "location": location if location else "Various locations",
-            "url": f"https://www.indeed.com/jobs?q={urllib.parse.quote(keyword)}&l={urllib.parse.quote(location) if location else ''}",
-            "date_posted": "",
-            "scrape_time": datetime.now().isoformat()
-        }
-        all_jobs.append(job)
+        filter_frame = ttk.Frame(self.frame)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT, padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=30)
+        filter_entry.pack(side=tk.LEFT)
+        filter_entry.bind("<KeyRelease>", lambda e: self.apply_filter())
         
-        return all_jobs
+        table_frame = ttk.Frame(self.frame)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.tree = ttk.Treeview(table_frame, columns=[c[0] for c in self.COLUMNS], show="headings", selectmode="browse")
+        for column, heading, width in self.COLUMNS:
+            self.tree.heading(column, text=heading, command=lambda c=column: self.sort(c, toggle=True))
+            self.tree.column(column, width=width, anchor=tk.W, stretch=(column == "title"))
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree.bind("<Double-1>", lambda e: self.open_selected())
+        self.tree.bind("<Return>", lambda e: self.open_selected())
+        
+        self.jobs = {}
+        self.scores = {}
+        self.item_ids = {}
+        self.sort_column = "score"
+        self.sort_reverse = True
+    
+    def _matches_filter(self, job):
+        text = self.filter_var.get().strip().lower()
+        if not text:
+            return True
+        return text in f"{job['title']} {job['company']} {job['location']}".lower()
+    
+    def _values(self, job, score):
+        return (f"{score:.2f}", job["title"], job["company"], job["location"], job["date_posted"])
+    
+    def append(self, ranked_jobs):
+        """Append (job, score) rows; jobs that are already shown get their score updated"""
+        for job, score in ranked_jobs:
+            item = self.item_ids.get(id(job))
+            if item is not None:
+                self.scores[item] = score
+                self.tree.set(item, "score", f"{score:.2f}")
+                continue
+            
+            item = self.tree.insert("", tk.END, values=self._values(job, score))
+            self.item_ids[id(job)] = item
+            self.jobs[item] = job
+            self.scores[item] = score
+            if not self._matches_filter(job):
+                self.tree.detach(item)
+    
+    def show(self, ranked_jobs):
+        """Show a full ranked result set, reusing the rows that already exist"""
+        self.append(ranked_jobs)
+        self.sort(self.sort_column)
+    
+    def _sort_key(self, column):
+        if column == "score":
+            return lambda item: self.scores[item]
+        return lambda item: self.jobs[item][column].lower()
+    
+    def sort(self, column, toggle=False):
+        """Reorder the visible rows by a column; clicking the same heading again reverses the order"""
+        if toggle:
+            self.sort_reverse = not self.sort_reverse if column == self.sort_column else column == "score"
+        self.sort_column = column
+        
+        visible = sorted(self.tree.get_children(""), key=self._sort_key(column), reverse=self.sort_reverse)
+        for index, item in enumerate(visible):
+            self.tree.move(item, "", index)
+    
+    def apply_filter(self):
+        """Detach rows that do not match the filter text and reattach the ones that do"""
+        for item, job in self.jobs.items():
+            if self._matches_filter(job):
+                self.tree.move(item, "", tk.END)
+            else:
+                self.tree.detach(item)
+        self.sort(self.sort_column)
+    
+    def open_selected(self):
+        for item in self.tree.selection():
+            webbrowser.open(self.jobs[item]["url"])
+    
+    def clear(self):
+        if self.jobs:
+            self.tree.delete(*self.jobs)
+        self.jobs.clear()
+        self.scores.clear()
+        self.item_ids.clear()
+
+CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".jobmatch_config.json")
+RESPONSE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".jobmatch_cache.sqlite")
+JOB_STORE_FILE = os.path.join(os.path.expanduser("~"), ".jobmatch_jobs.sqlite")
+
+DEFAULT_SCRAPER_OPTIONS = {
+    "max_jobs_per_keyword": 8,
+    "locations": ["Remote"],
+    "job_types": [""],
+    "experience_levels": [""],
+    "requests_per_second": 0.5,
+    "max_requests_per_second": 1.0,
+    "max_concurrent_queries": 8,
+    "cache_ttl_seconds": 3600,
+    "cache_max_entries": 5000,
+    "skill_taxonomy_file": SKILL_TAXONOMY_FILE,
+    "fetch_descriptions": False,
+    "detail_fetch_workers": 4,
+    "incremental_search": True,
+    "parser_backend": "auto",
+    "cpu_workers": None,
+    "results_archive_dir": RESULTS_ARCHIVE_DIR,
+    "plan_queries": True,
+    "max_query_length": 120,
+    "max_skills_per_query": 5,
+    "search_deadline_seconds": 180
+}
+
+def load_scraper_options(config_file=CONFIG_FILE):
+    """Return the default scraper options updated with any saved in the config file"""
+    options = dict(DEFAULT_SCRAPER_OPTIONS)
+    if os.path.exists(config_file):
+        try:
+            with open(config_file, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            options.update(config.get("scraper_options", {}))
+        except:
+            pass
+    return options
 
 class JobMatchAgent:
+    # How often the main loop drains worker events, and how long one drain may take
+    UI_POLL_MS = 50
+    UI_DRAIN_BUDGET = 0.03
+    RESULT_FILE_TYPES = [
+        ("Compressed JSON Lines", "*.jsonl.gz"),
+        ("Zstandard JSON Lines", "*.jsonl.zst"),
+        ("JSON Lines", "*.jsonl"),
+        ("JSON Files", "*.json")
+    ]
+    
     def __init__(self, root):
         self.root = root
         self.root.title("JobMatch AI ")
@@ -215,16 +2441,41 @@ class JobMatchAgent:
         self.keywords = []
         self.jobs = []
         self.search_in_progress = False
-        self.scraper_options = {
-            "max_jobs_per_keyword": 8,
-            "locations": ["Remote"],
-            "job_types": [""],
-            "experience_levels": [""]
-        }
+        self.scraper_options = dict(DEFAULT_SCRAPER_OPTIONS)
         
-        # Initialize scrapers
-        self.linkedin_scraper = LinkedInJobScraper(delay_between_requests=1.5)
-        self.indeed_scraper = IndeedJobScraper(delay_between_requests=1.5)
+        # Compile the skill taxonomy once at startup
+        self.skill_matcher = load_skill_matcher()
+        self.skill_taxonomy_file = SKILL_TAXONOMY_FILE
+        self.cpu_pool = None
+        self.pdf_extractor = PdfTextExtractor()
+        self.ranker = JobRanker(self.skill_matcher)
+        self.job_index = JobIndex()
+        
+        # Initialize scrapers with one shared per-host rate limiter and response cache
+        self.rate_limiter = HostRateLimiter(
+            requests_per_second=self.scraper_options["requests_per_second"],
+            max_requests_per_second=self.scraper_options["max_requests_per_second"]
+        )
+        self.response_cache = ResponseCache(
+            RESPONSE_CACHE_FILE,
+            ttl=self.scraper_options["cache_ttl_seconds"],
+            max_entries=self.scraper_options["cache_max_entries"]
+        )
+        self.job_store = JobStore(JOB_STORE_FILE)
+        # Every registered job source shares one pooled session
+        self.http_session = create_http_session()
+        self.sources = create_sources(
+            delay_between_requests=1.5, rate_limiter=self.rate_limiter, cache=self.response_cache,
+            session=self.http_session, job_store=self.job_store
+        )
+        self.linkedin_scraper = self.sources["LinkedIn"]
+        self.query_planner = QueryPlanner(self.skill_matcher)
+        self.search_executor = ConcurrentSearchExecutor(
+            self.sources, max_workers=self.scraper_options["max_concurrent_queries"], planner=self.query_planner
+        )
+        self.detail_fetcher = JobDetailFetcher(
+            self.linkedin_scraper, max_workers=self.scraper_options["detail_fetch_workers"], job_store=self.job_store
+        )
         
         # Set up styles
         self.style = ttk.Style()
@@ -236,8 +2487,13 @@ class JobMatchAgent:
         self.create_widgets()
         
         # Load config if exists
-        self.config_file = os.path.join(os.path.expanduser("~"), ".jobmatch_config.json")
+        self.config_file = CONFIG_FILE
         self.load_config()
+        
+        # Worker threads never touch Tk directly; they post events that the main loop drains
+        self.ui_events = queue.Queue()
+        self.results_lock = threading.Lock()
+        self.root.after(self.UI_POLL_MS, self.drain_ui_events)
     
     def create_menu(self):
         menu_bar = tk.Menu(self.root)
@@ -245,11 +2501,13 @@ class JobMatchAgent:
         file_menu = tk.Menu(menu_bar, tearoff=0)
         file_menu.add_command(label="Upload CV", command=self.upload_cv)
         file_menu.add_command(label="Save Results", command=self.save_results)
+        file_menu.add_command(label="Load Results", command=self.load_results)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         
         tools_menu = tk.Menu(menu_bar, tearoff=0)
         tools_menu.add_command(label="Preferences", command=self.show_preferences)
+        tools_menu.add_command(label="Performance Metrics", command=self.show_metrics)
         tools_menu.add_command(label="Clear All Data", command=self.clear_all)
         
         help_menu = tk.Menu(menu_bar, tearoff=0)
@@ -297,7 +2555,7 @@ class JobMatchAgent:
         ttk.Label(source_frame, text="Source:").pack(side=tk.LEFT, padx=(0, 5))
         
         self.source_var = tk.StringVar(value="LinkedIn")
-        sources = ttk.Combobox(source_frame, textvariable=self.source_var, values=["LinkedIn", "Indeed", "Both"], width=10, state="readonly")
+        sources = ttk.Combobox(source_frame, textvariable=self.source_var, values=list(JOB_SOURCES) + ["All"], width=10, state="readonly")
         sources.pack(side=tk.LEFT)
         
         # File info
@@ -325,18 +2583,8 @@ class JobMatchAgent:
         results_frame = ttk.LabelFrame(main_frame, text="Job Matches", padding="10")
         results_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Create canvas for scrolling
-        self.canvas = tk.Canvas(results_frame)
-        scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=self.canvas.yview)
-        
-        self.results_container = ttk.Frame(self.canvas)
-        self.results_container.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        
-        self.canvas.create_window((0, 0), window=self.results_container, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Sortable, filterable table; double-click a row to open the job
+        self.results_view = ResultsView(results_frame)
         
         # Progress bar
         self.progress_var = tk.DoubleVar()
@@ -362,13 +2610,29 @@ class JobMatchAgent:
             
             # Extract text in a separate thread to prevent UI freezing
             def extract_text():
-                self.cv_text = self.extract_text_from_pdf(path)
-                self.keywords = self.extract_tech_terms(self.cv_text)
-                self.display_keywords()
+                pages = []
+                found = set()
+                start = time.perf_counter()
+                try:
+                    # Surface skills page by page while later pages are still parsing
+                    for page_text in self.pdf_extractor.iter_pages(path):
+                        pages.append(page_text)
+                        new_skills = set(self.extract_tech_terms(page_text)) - found
+                        if new_skills:
+                            found |= new_skills
+                            self.post_event("call", (self.set_keywords, sorted(found, key=str.lower)))
+                        self.post_event("status", f"Extracting text from CV... page {len(pages)}")
+                except Exception as e:
+                    metrics.record_error("cv_extract", e)
+                    self.post_event("status", f"Error processing CV: PDF extraction error: {str(e)}")
+                    return
+                metrics.observe("cv_extract_seconds", time.perf_counter() - start)
                 
-                self.file_info_var.set(f"Loaded: {os.path.basename(path)}")
-                self.search_button.config(state=tk.NORMAL)
-                self.status_var.set("CV processed successfully")
+                self.cv_text = "\n".join(pages)
+                self.post_event("call", (self.set_keywords, self.extract_tech_terms(self.cv_text)))
+                self.post_event("call", (self.file_info_var.set, f"Loaded: {os.path.basename(path)}"))
+                self.post_event("call", (self.search_button.config, {"state": tk.NORMAL}))
+                self.post_event("status", "CV processed successfully")
             
             threading.Thread(target=extract_text).start()
             
@@ -376,29 +2640,23 @@ class JobMatchAgent:
             messagebox.showerror("Error", f"Failed to extract text from PDF: {str(e)}")
             self.status_var.set("Error processing CV")
     
-    def extract_text_from_pdf(self, path):
-        try:
-            doc = fitz.open(path)
-            text = "\n".join([page.get_text() for page in doc])
-            doc.close()
-            return text
-        except Exception as e:
-            raise Exception(f"PDF extraction error: {str(e)}")
-    
     def extract_tech_terms(self, text):
-        # Comprehensive list of technologies, frameworks, languages, etc.
-        tech_pattern = r"\b(?:Angular|React|Vue\.js|Svelte|Next\.js|Gatsby|jQuery|D3\.js|" + \
-                      r"Spring Boot|Django|Flask|Laravel|Ruby on Rails|ASP\.NET|Express|Symfony|FastAPI|" + \
-                      r"Node\.js|Java|Python|C\+\+|C#|Ruby|PHP|Go|Rust|Swift|Kotlin|TypeScript|JavaScript|" + \
-                      r"MongoDB|MySQL|PostgreSQL|Oracle|SQL Server|Redis|Cassandra|DynamoDB|" + \
-                      r"Docker|Kubernetes|AWS|Azure|GCP|Terraform|Ansible|Jenkins|Git|" + \
-                      r"TensorFlow|TensorFlow|PyTorch|Scikit-learn|Keras|Pandas|NumPy|Matplotlib|OpenCV|NLTK|SpaCy)\b"
-        found = re.findall(tech_pattern, text, re.IGNORECASE)
-        return sorted(set(map(str.title, found)))
+        # Canonical skill names from the precompiled taxonomy matcher, run off the GIL when possible
+        if self.cpu_pool is not None:
+            try:
+                return sorted(self.cpu_pool.count_skills([text])[0], key=str.lower)
+            except BrokenProcessPool as e:
+                metrics.record_error("cpu_pool", e)
+                self.cpu_pool = None
+        return sorted(self.skill_matcher.extract(text), key=str.lower)
 
     def display_keywords(self):
         self.keywords_var.set(", ".join(self.keywords))
 
+    def set_keywords(self, keywords):
+        self.keywords = keywords
+        self.display_keywords()
+
     def add_keyword(self):
         new_kw = self.keyword_entry.get().strip()
         if new_kw and new_kw not in self.keywords:
@@ -410,92 +2668,577 @@ class JobMatchAgent:
         if not self.keywords:
             messagebox.showwarning("No keywords", "Please upload a CV or add keywords.")
             return
+        if self.search_in_progress:
+            return
 
         self.jobs.clear()
+        self.ranker.clear()
+        self.job_index.clear()
+        self.results_view.clear()
+        self.search_in_progress = True
+        self.search_button.config(state=tk.DISABLED)
         self.status_var.set("Searching for jobs...")
         self.progress_var.set(0)
         self.job_count_var.set("Searching...")
 
+        # Read Tk state on the main thread; the worker only sees plain values
+        source = self.source_var.get()
+        sources = list(self.sources) if source == "All" else [source]
+        keywords = list(self.keywords)
+        max_jobs = self.scraper_options["max_jobs_per_keyword"]
+        locations = self.scraper_options["locations"]
+        fetch_descriptions = self.scraper_options["fetch_descriptions"]
+        incremental = self.scraper_options["incremental_search"]
+        plan_queries = self.scraper_options["plan_queries"]
+        deadline = self.scraper_options["search_deadline_seconds"]
+        archive = self.open_run_archive()
+
+        def ingest(jobs):
+            new_jobs = []
+            with self.results_lock:
+                for job in jobs:
+                    record, is_new, added_keywords = self.job_index.add(job)
+                    if is_new:
+                        new_jobs.append(record)
+                    elif not fetch_descriptions:
+                        # Only keywords the record did not already have are new mentions
+                        confirmed = QueryPlanner.confirmed_keywords(job)
+                        for keyword in added_keywords:
+                            if keyword in confirmed:
+                                self.ranker.add_keyword(record, keyword)
+                self.jobs.extend(new_jobs)
+                if not fetch_descriptions:
+                    self.ranker.add(new_jobs)
+            if new_jobs:
+                self.post_event("jobs", [(job, 0.0) for job in new_jobs])
+                if archive and not fetch_descriptions:
+                    archive.write(new_jobs)
+
+        def on_page(query, jobs):
+            # Called from search worker threads as soon as a page is parsed
+            self.job_store.add([job for job in jobs if job["job_id"].isdigit()], location=query[2])
+            ingest(jobs)
+
         def search():
-            sources = self.source_var.get()
-            max_jobs = self.scraper_options["max_jobs_per_keyword"]
-            locations = self.scraper_options["locations"]
-            total_keywords = len(self.keywords)
+            if plan_queries:
+                # Related skills share one OR query; jobs are attributed back to skills locally
+                queries, limits, report = self.query_planner.plan(keywords, locations, sources, max_jobs)
+                self.post_event("status", f"Planned {report['planned_queries']} queries instead of "
+                                          f"{report['naive_queries']}, saving about {report['requests_saved']} requests")
+            else:
+                queries, limits = self.search_executor.build_queries(keywords, locations, sources), None
             count = 0
+            start = time.perf_counter()
 
-            for kw in self.keywords:
-                for loc in locations:
-                    jobs = []
-                    if sources in ["LinkedIn", "Both"]:
-                        jobs += self.linkedin_scraper.search_jobs(kw, location=loc, max_jobs=max_jobs)
-                    if sources in ["Indeed", "Both"]:
-                        jobs += self.indeed_scraper.search_jobs(kw, location=loc, max_jobs=max_jobs)
-                    self.jobs.extend(jobs)
+            if incremental:
+                # Serve previously stored postings instantly; the scrapers then only fetch newer ones
+                for source, kw, loc in queries:
+                    if source == "LinkedIn":
+                        for skill in QueryPlanner.skills_of(kw):
+                            ingest(self.job_store.query(keyword=skill, location=loc, limit=max_jobs))
 
+            for query, jobs in self.search_executor.run(queries, max_jobs=max_jobs, on_page=on_page, incremental=incremental,
+                                                        limits=limits, deadline=deadline):
+                # Sources need not call on_page and partial results at the deadline only
+                # arrive here; records already delivered page by page are skipped by the index
+                ingest(jobs)
+                # Only LinkedIn searches are replayed by incremental refreshes
+                if query[0] == "LinkedIn":
+                    self.job_store.record_query(query[1], query[2])
                 count += 1
-                self.progress_var.set((count / total_keywords) * 100)
-                self.root.update_idletasks()
+                self.post_event("progress", (count / len(queries)) * 100)
+                self.post_event("status", f"Searching for jobs... {count}/{len(queries)} queries")
 
-            self.display_results()
-            self.status_var.set("Search complete")
-            self.job_count_var.set(f"Found {len(self.jobs)} jobs")
+            # Past the deadline, rank what has arrived instead of fetching descriptions;
+            # the executor's own clock decides, so the preload above does not count
+            timed_out = self.search_executor.deadline_exceeded
+            if fetch_descriptions and timed_out:
+                with self.results_lock:
+                    jobs = list(self.jobs)
+                    self.ranker.add(jobs)
+                if archive:
+                    archive.write(jobs)
+            elif fetch_descriptions:
+                # Second stage: index each job once its description has been fetched
+                self.post_event("progress", 0)
+                count = 0
+                for job, description in self.detail_fetcher.fetch(list(self.jobs)):
+                    with self.results_lock:
+                        self.ranker.add([job])
+                    if archive:
+                        archive.write([job])
+                    count += 1
+                    self.post_event("status", f"Fetching job details... {count}/{len(self.jobs)}")
+                    self.post_event("progress", (count / len(self.jobs)) * 100)
 
-        threading.Thread(target=search).start()
+            if archive:
+                archive.close()
+            metrics.observe("search_seconds", time.perf_counter() - start)
+            self.post_event("call", (self.finish_search, timed_out))
 
-    def display_results(self):
-        for widget in self.results_container.winfo_children():
-            widget.destroy()
+        threading.Thread(target=search, daemon=True).start()
+
+    def open_run_archive(self):
+        """Start a compressed JSON Lines archive for this search run, or return None when archiving is off"""
+        archive_dir = self.scraper_options["results_archive_dir"]
+        if not archive_dir:
+            return None
+        try:
+            os.makedirs(archive_dir, exist_ok=True)
+            return JobExporter(os.path.join(archive_dir, f"run-{datetime.now():%Y%m%d-%H%M%S}.jsonl.gz"))
+        except Exception as e:
+            metrics.record_error("results_archive", e)
+            return None
+
+    def finish_search(self, timed_out=False):
+        self.display_results()
+        cache_stats = self.response_cache.stats()
+        outcome = "Search deadline reached, showing partial results" if timed_out else "Search complete"
+        self.status_var.set(f"{outcome} (cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses)")
+        self.job_count_var.set(f"Found {len(self.jobs)} jobs ({self.job_index.duplicates} duplicates merged)")
+        self.search_in_progress = False
+        self.search_button.config(state=tk.NORMAL)
+
+    def post_event(self, kind, payload):
+        """
+        Queue an update for the Tk main loop; safe to call from any thread
+        
+        Args:
+            kind (str): "jobs" (list of (job, score) rows), "progress" (percentage),
+                        "status" (text) or "call" (tuple of a callable and its arguments)
+            payload: The event data
+        """
+        self.ui_events.put((kind, payload))
+
+    def drain_ui_events(self):
+        """Apply queued worker events on the main loop, coalescing rows and progress updates"""
+        rows = []
+        progress = status = None
+        deadline = time.monotonic() + self.UI_DRAIN_BUDGET
+
+        def flush():
+            if rows:
+                try:
+                    with metrics.timer("render_seconds", step="append"):
+                        self.results_view.append(rows)
+                except Exception as e:
+                    metrics.record_error("ui_render", e)
+                self.job_count_var.set(f"Found {len(self.results_view.jobs)} jobs so far")
+                rows.clear()
 
-        for job in self.jobs:
-            frame = ttk.Frame(self.results_container, relief=tk.RIDGE, padding=5)
-            frame.pack(fill=tk.X, pady=2)
+        try:
+            while time.monotonic() < deadline:
+                kind, payload = self.ui_events.get_nowait()
+                if kind == "jobs":
+                    rows.extend(payload)
+                elif kind == "progress":
+                    progress = payload
+                elif kind == "status":
+                    status = payload
+                elif kind == "call":
+                    # Keep ordering: rows queued before the call are shown first
+                    flush()
+                    if status is not None:
+                        self.status_var.set(status)
+                        status = None
+                    func, *args = payload
+                    # One failing update must not stop the events queued after it
+                    try:
+                        func(*args)
+                    except Exception as e:
+                        metrics.record_error("ui_event", e)
+        except queue.Empty:
+            pass
+        finally:
+            try:
+                flush()
+                if progress is not None:
+                    self.progress_var.set(progress)
+                if status is not None:
+                    self.status_var.set(status)
+            finally:
+                # Always poll again, or worker events would never be applied after an error
+                self.root.after(self.UI_POLL_MS, self.drain_ui_events)
 
-            title = ttk.Label(frame, text=job['title'], font=('Arial', 12, 'bold'), foreground='blue', cursor='hand2')
-            title.pack(anchor=tk.W)
-            title.bind("<Button-1>", lambda e, url=job['url']: webbrowser.open(url))
+    def ranked_jobs(self):
+        """Return (job, score) pairs for the current results, best match first"""
+        with metrics.timer("rank_seconds"):
+            return self.ranker.rank(self.keywords)
 
-            ttk.Label(frame, text=f"{job['company']} - {job['location']}").pack(anchor=tk.W)
-            ttk.Label(frame, text=f"Posted: {job['date_posted']}").pack(anchor=tk.W)
+    def display_results(self):
+        ranked = self.ranked_jobs()
+        with metrics.timer("render_seconds", step="show"):
+            self.results_view.show(ranked)
 
     def save_results(self):
         if not self.jobs:
             messagebox.showwarning("No data", "No job results to save.")
             return
 
-        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Files", "*.json")])
+        path = filedialog.asksaveasfilename(defaultextension=".jsonl.gz", filetypes=self.RESULT_FILE_TYPES)
         if path:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self.jobs, f, indent=2)
+            try:
+                if path.endswith(".json"):
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump([job.to_dict(score=round(score, 4)) for job, score in self.ranked_jobs()], f)
+                else:
+                    export_jobs(path, self.ranked_jobs())
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save results: {str(e)}")
+                return
             messagebox.showinfo("Saved", f"Results saved to {path}")
 
+    def load_results(self):
+        """Stream a saved results file back into the results view, ranker and job store"""
+        if self.search_in_progress:
+            return
+        path = filedialog.askopenfilename(filetypes=self.RESULT_FILE_TYPES)
+        if not path:
+            return
+
+        self.jobs.clear()
+        self.ranker.clear()
+        self.job_index.clear()
+        self.results_view.clear()
+        self.search_in_progress = True
+        self.search_button.config(state=tk.DISABLED)
+        self.status_var.set(f"Loading {os.path.basename(path)}...")
+
+        def load():
+            batch = []
+
+            def flush():
+                new_jobs = []
+                with self.results_lock:
+                    for job in batch:
+                        record, is_new, _ = self.job_index.add(job)
+                        if is_new:
+                            new_jobs.append(record)
+                    self.jobs.extend(new_jobs)
+                    self.ranker.add(new_jobs)
+                self.job_store.add([job for job in new_jobs if job["job_id"].isdigit()])
+                self.post_event("jobs", [(job, 0.0) for job in new_jobs])
+                self.post_event("status", f"Loading {os.path.basename(path)}... {len(self.jobs)} jobs")
+                batch.clear()
+
+            try:
+                for job in iter_job_file(path):
+                    batch.append(job)
+                    if len(batch) >= 500:
+                        flush()
+                flush()
+            except Exception as e:
+                self.post_event("call", (messagebox.showerror, "Error", f"Failed to load results: {str(e)}"))
+            self.post_event("call", (self.finish_search,))
+
+        threading.Thread(target=load, daemon=True).start()
+
     def show_about(self):
         messagebox.showinfo("About", "JobMatch AI Agent\nCreated in 2025 for job matching using CV parsing and scraping.")
 
     def show_preferences(self):
         messagebox.showinfo("Preferences", "Preferences are not implemented yet.")
 
+    def show_metrics(self):
+        """Show per-stage timings and counters, with refresh, export and reset"""
+        window = tk.Toplevel(self.root)
+        window.title("Performance Metrics")
+        window.geometry("720x480")
+
+        text = tk.Text(window, font=("Courier", 10), wrap=tk.NONE)
+        scrollbar = ttk.Scrollbar(window, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+
+        def refresh():
+            text.config(state=tk.NORMAL)
+            text.delete("1.0", tk.END)
+            text.insert(tk.END, metrics.summary())
+            text.config(state=tk.DISABLED)
+
+        def export():
+            path = filedialog.asksaveasfilename(
+                parent=window, defaultextension=".json",
+                filetypes=[("JSON Files", "*.json"), ("Prometheus text", "*.prom")]
+            )
+            if path:
+                metrics.write(path)
+
+        def reset():
+            metrics.reset()
+            refresh()
+
+        button_frame = ttk.Frame(window, padding="5")
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        ttk.Button(button_frame, text="Refresh", command=refresh).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text="Export...", command=export).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text="Reset", command=reset).pack(side=tk.LEFT)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(fill=tk.BOTH, expand=True)
+        refresh()
+
     def clear_all(self):
         self.cv_text = ""
         self.keywords = []
         self.jobs = []
+        self.ranker.clear()
+        self.job_index.clear()
         self.keywords_var.set("")
         self.job_count_var.set("No jobs found")
         self.file_info_var.set("")
         self.progress_var.set(0)
-        for widget in self.results_container.winfo_children():
-            widget.destroy()
+        self.results_view.clear()
 
     def load_config(self):
-        if os.path.exists(self.config_file):
+        self.scraper_options.update(load_scraper_options(self.config_file))
+        
+        # Apply concurrency settings that may have been overridden by the config
+        self.rate_limiter.requests_per_second = self.scraper_options["requests_per_second"]
+        self.rate_limiter.max_requests_per_second = self.scraper_options["max_requests_per_second"]
+        self.search_executor.max_workers = self.scraper_options["max_concurrent_queries"]
+        self.response_cache.ttl = self.scraper_options["cache_ttl_seconds"]
+        self.response_cache.max_entries = self.scraper_options["cache_max_entries"]
+        self.detail_fetcher.max_workers = self.scraper_options["detail_fetch_workers"]
+        self.query_planner.max_query_length = self.scraper_options["max_query_length"]
+        self.query_planner.max_skills_per_query = self.scraper_options["max_skills_per_query"]
+        try:
+            self.linkedin_scraper.parser = JobCardParser(self.scraper_options["parser_backend"])
+        except (ValueError, ImportError) as e:
+            messagebox.showwarning("Parser backend", f"Could not use the configured parser, using the default: {str(e)}")
+        if self.scraper_options["skill_taxonomy_file"] != SKILL_TAXONOMY_FILE:
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                self.scraper_options.update(config.get("scraper_options", {}))
-            except:
-                pass
+                self.skill_matcher = load_skill_matcher(self.scraper_options["skill_taxonomy_file"])
+                self.skill_taxonomy_file = self.scraper_options["skill_taxonomy_file"]
+                self.ranker.skill_matcher = self.skill_matcher
+                self.query_planner.skill_matcher = self.skill_matcher
+            except Exception as e:
+                messagebox.showwarning("Skill taxonomy", f"Could not load skill taxonomy, using the default: {str(e)}")
+        
+        # CPU-bound stages run in worker processes built with the final taxonomy and parser
+        if self.scraper_options["cpu_workers"] != 0:
+            self.cpu_pool = CpuWorkerPool(
+                max_workers=self.scraper_options["cpu_workers"],
+                taxonomy_file=self.skill_taxonomy_file,
+                parser_backend=self.linkedin_scraper.parser.backend
+            )
+            self.linkedin_scraper.cpu_pool = self.cpu_pool
+            self.ranker.cpu_pool = self.cpu_pool
+            self.pdf_extractor.executor = self.cpu_pool.executor
 
-# To run the application
-if __name__ == "__main__":
+def _extract_cv_skills(path, taxonomy_file):
+    """Extract the skills of one CV (runs in worker processes)"""
+    # One process per CV already saturates the cores, so pages are not split further
+    extractor = PdfTextExtractor(max_workers=1)
+    text = extractor.extract_text(path)
+    return sorted(load_skill_matcher(taxonomy_file).extract(text), key=str.lower)
+
+def run_batch(cv_dir, output_dir, sources=("LinkedIn",), locations=None, max_jobs=None, workers=None,
+              fetch_descriptions=False, options=None, deadline=None):
+    """
+    Match every PDF CV in a directory against job listings without a GUI
+    
+    CVs are parsed across a process pool. Each distinct (source, keyword, location)
+    query is searched once and shared by every CV with that skill, so CVs with
+    identical skill sets share one job search.
+    
+    Args:
+        cv_dir (str): Directory containing PDF CVs
+        output_dir (str): Directory where one JSON result file per CV is written
+        sources (tuple): Names of registered job sources to search
+        locations (list): Locations to search, defaults to the configured ones
+        max_jobs (int): Maximum number of jobs per query, defaults to the configured value
+        workers (int): Number of CV parsing processes, defaults to the CPU count
+        fetch_descriptions (bool): Fetch each job's detail page so ranking also uses descriptions
+        options (dict): Scraper options, defaults to those in the config file
+        deadline (float): Seconds after which the search stops and CVs are ranked on partial
+                          results, defaults to the configured search_deadline_seconds
+        
+    Returns:
+        dict: CV file name -> number of matched jobs
+    """
+    options = options or load_scraper_options()
+    locations = locations or options["locations"]
+    max_jobs = max_jobs or options["max_jobs_per_keyword"]
+    if deadline is None:
+        deadline = options["search_deadline_seconds"]
+    
+    paths = sorted(
+        os.path.join(cv_dir, name) for name in os.listdir(cv_dir) if name.lower().endswith(".pdf")
+    )
+    if not paths:
+        return {}
+    
+    cv_skills = {}
+    with metrics.timer("cv_batch_extract_seconds"), ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_extract_cv_skills, path, options["skill_taxonomy_file"]): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                cv_skills[path] = future.result()
+            except Exception as e:
+                metrics.inc("errors_total", stage="cv_extract")
+                print(f"Skipping {os.path.basename(path)}: PDF extraction error: {str(e)}")
+    
+    rate_limiter = HostRateLimiter(
+        requests_per_second=options["requests_per_second"],
+        max_requests_per_second=options["max_requests_per_second"]
+    )
+    cache = ResponseCache(RESPONSE_CACHE_FILE, ttl=options["cache_ttl_seconds"], max_entries=options["cache_max_entries"])
+    # Scraped postings and their descriptions are kept in the local job store, as in the GUI
+    job_store = JobStore(JOB_STORE_FILE)
+    # Page parsing and skill matching for the searches also scale across cores
+    cpu_pool = CpuWorkerPool(max_workers=workers, taxonomy_file=options["skill_taxonomy_file"], parser_backend=options["parser_backend"])
+    matcher = load_skill_matcher(options["skill_taxonomy_file"])
+    planner = QueryPlanner(
+        matcher, max_query_length=options["max_query_length"], max_skills_per_query=options["max_skills_per_query"]
+    )
+    executor = ConcurrentSearchExecutor(
+        create_sources(
+            list(sources), rate_limiter=rate_limiter, cache=cache, session=create_http_session(),
+            parser=JobCardParser(options["parser_backend"]), cpu_pool=cpu_pool
+        ),
+        max_workers=options["max_concurrent_queries"],
+        planner=planner
+    )
+    
+    # Search each distinct query once, however many CVs share it
+    unique_skills = sorted({skill for skills in cv_skills.values() for skill in skills}, key=str.lower)
+    if options["plan_queries"]:
+        queries, limits, report = planner.plan(unique_skills, locations, list(sources), max_jobs)
+        print(f"Planned {report['planned_queries']} queries instead of {report['naive_queries']}, "
+              f"saving about {report['requests_saved']} requests")
+    else:
+        queries, limits = executor.build_queries(unique_skills, locations, list(sources)), None
+    
+    def on_page(query, jobs):
+        job_store.add([job for job in jobs if job["job_id"].isdigit()], location=query[2])
+    
+    # Jobs are filed under the single-skill queries they were attributed to
+    results = {}
+    for count, (query, jobs) in enumerate(
+        executor.run(queries, max_jobs=max_jobs, on_page=on_page, limits=limits, deadline=deadline), 1
+    ):
+        for job in jobs:
+            for skill in job.get("keywords") or [job["keyword"]]:
+                results.setdefault((query[0], skill, query[2]), []).append(job)
+        print(f"[{count}/{len(queries)}] {query[0]}: {query[1]} in {query[2] or 'any location'} -> {len(jobs)} jobs")
+    
+    if fetch_descriptions and "LinkedIn" in executor.scrapers:
+        fetcher = JobDetailFetcher(
+            executor.scrapers["LinkedIn"], max_workers=options["detail_fetch_workers"], job_store=job_store
+        )
+        all_jobs = list({id(job): job for jobs in results.values() for job in jobs}.values())
+        for count, (job, description) in enumerate(fetcher.fetch(all_jobs), 1):
+            if count % 25 == 0 or count == len(all_jobs):
+                print(f"Fetched details for {count}/{len(all_jobs)} jobs")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    summary = {}
+    for path, skills in sorted(cv_skills.items()):
+        # Copies keep the keywords merged for one CV from leaking into another
+        index = JobIndex()
+        for query in executor.build_queries(skills, locations, list(sources)):
+            for job in results.get(query, []):
+                index.add(job.copy())
+        ranker = JobRanker(matcher, cpu_pool=cpu_pool)
+        ranker.add(index.jobs)
+        jobs = [job.to_dict(score=round(score, 4)) for job, score in ranker.rank(skills)]
+        name = os.path.basename(path)
+        with open(os.path.join(output_dir, os.path.splitext(name)[0] + ".json"), "w", encoding="utf-8") as f:
+            json.dump({"cv": name, "skills": skills, "jobs": jobs}, f, indent=2)
+        summary[name] = len(jobs)
+    
+    cpu_pool.shutdown()
+    return summary
+
+def run_refresh(options=None):
+    """
+    Incrementally refresh every query stored in the local job store
+    
+    Each query is searched newest first and stops at the first posting already
+    stored, so a scheduled refresh usually costs one or two pages per query.
+    Like other searches it stops after the configured search_deadline_seconds.
+    
+    Returns:
+        int: Number of new jobs stored
+    """
+    options = options or load_scraper_options()
+    job_store = JobStore(JOB_STORE_FILE)
+    rate_limiter = HostRateLimiter(
+        requests_per_second=options["requests_per_second"],
+        max_requests_per_second=options["max_requests_per_second"]
+    )
+    # Refreshing must see the live first page, not a cached copy of it
+    scraper = LinkedInJobScraper(rate_limiter=rate_limiter, job_store=job_store, parser=JobCardParser(options["parser_backend"]))
+    # Stored combined OR queries are refreshed as they are and attributed back to skills
+    planner = QueryPlanner(load_skill_matcher(options["skill_taxonomy_file"]))
+    executor = ConcurrentSearchExecutor({"LinkedIn": scraper}, max_workers=options["max_concurrent_queries"], planner=planner)
+    
+    queries = [("LinkedIn", keyword, location) for keyword, location in job_store.stored_queries()]
+    new_jobs = 0
+    
+    def on_page(query, jobs):
+        job_store.add(jobs, location=query[2])
+    
+    for query, jobs in executor.run(queries, max_jobs=options["max_jobs_per_keyword"], on_page=on_page, incremental=True,
+                                    deadline=options["search_deadline_seconds"]):
+        job_store.record_query(query[1], query[2])
+        new_jobs += len(jobs)
+        print(f"{query[1]} in {query[2] or 'any location'}: {len(jobs)} new jobs")
+    
+    return new_jobs
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="JobMatch AI - match CVs against job listings")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch = subparsers.add_parser("batch", help="Match a directory of PDF CVs without the GUI")
+    batch.add_argument("cv_dir", help="Directory containing PDF CVs")
+    batch.add_argument("-o", "--output-dir", default="jobmatch_results", help="Where to write one JSON file per CV")
+    batch.add_argument("--source", choices=list(JOB_SOURCES) + ["All", "Both"], default="LinkedIn",
+                       help="Job source to search; All (or Both) searches every registered source")
+    batch.add_argument("--location", action="append", dest="locations", help="Location to search (repeatable)")
+    batch.add_argument("--max-jobs", type=int, help="Maximum number of jobs per keyword and location")
+    batch.add_argument("--workers", type=int, help="Number of CV parsing processes")
+    batch.add_argument("--descriptions", action="store_true", help="Fetch job detail pages for description-based ranking")
+    batch.add_argument("--deadline", type=float, help="Stop searching after this many seconds and rank the partial results "
+                            "(default: search_deadline_seconds from the config)")
+    
+    refresh = subparsers.add_parser("refresh", help="Fetch postings newer than those in the local job store for every past query")
+    
+    for subparser in (batch, refresh):
+        subparser.add_argument(
+            "--metrics-out", help="Write per-stage timings and counters here (Prometheus text for .prom/.txt, JSON otherwise)"
+        )
+    return parser
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    
+    if args.command == "batch":
+        sources = tuple(JOB_SOURCES) if args.source in ("All", "Both") else (args.source,)
+        summary = run_batch(
+            args.cv_dir, args.output_dir, sources=sources, locations=args.locations,
+            max_jobs=args.max_jobs, workers=args.workers, fetch_descriptions=args.descriptions,
+            deadline=args.deadline
+        )
+        for name, count in summary.items():
+            print(f"{name}: {count} jobs")
+        print(f"Processed {len(summary)} CVs, results written to {args.output_dir}")
+        if args.metrics_out:
+            metrics.write(args.metrics_out)
+        return
+    
+    if args.command == "refresh":
+        print(f"Stored {run_refresh()} new jobs")
+        if args.metrics_out:
+            metrics.write(args.metrics_out)
+        return
+    
     root = tk.Tk()
     app = JobMatchAgent(root)
     root.mainloop()
+
+# To run the application
+if __name__ == "__main__":
+    main()
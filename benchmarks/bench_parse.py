@@ -0,0 +1,75 @@
+"""
+Parse throughput of the job card parser backends on saved LinkedIn result pages
+
+Checks that every installed backend returns the same job dictionaries as the
+BeautifulSoup backend, then reports cards parsed per second.
+
+    python benchmarks/bench_parse.py [--seconds 2]
+"""
+import argparse
+import glob
+import importlib.util
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aijobmatch import JobCardParser
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def load_fixture_pages():
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "linkedin_search_page_*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+def available_backends():
+    return [b for b in JobCardParser.BACKENDS if b == "bs4" or importlib.util.find_spec(b) is not None]
+
+def parse_without_timestamps(parser, html):
+    jobs, card_count = parser.parse(html, "Python")
+    return [{k: v for k, v in job.items() if k != "scrape_time"} for job in jobs], card_count
+
+def check_backends_agree(pages, backends):
+    """Return a list of (page, backend) pairs whose output differs from the bs4 backend"""
+    reference = JobCardParser("bs4")
+    mismatches = []
+    for name, html in pages.items():
+        expected = parse_without_timestamps(reference, html)
+        for backend in backends:
+            if parse_without_timestamps(JobCardParser(backend), html) != expected:
+                mismatches.append((name, backend))
+    return mismatches
+
+def measure_throughput(parser, pages, seconds):
+    """Parse the pages repeatedly for about `seconds` and return cards per second"""
+    cards = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for html in pages.values():
+            cards += parser.parse(html, "Python")[1]
+    return cards / (time.perf_counter() - start)
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--seconds", type=float, default=2.0, help="Measurement time per backend")
+    args = arg_parser.parse_args(argv)
+
+    pages = load_fixture_pages()
+    backends = available_backends()
+
+    mismatches = check_backends_agree(pages, backends)
+    for name, backend in mismatches:
+        print(f"MISMATCH: {backend} output differs from bs4 on {name}")
+
+    for backend in backends:
+        rate = measure_throughput(JobCardParser(backend), pages, args.seconds)
+        print(f"{backend:>10}: {rate:10.0f} cards/sec")
+
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Offline benchmark suite for the scraping, extraction, matching and rendering paths
+
+Runs without network access: searches go to a local LinkedIn stand-in server,
+CVs are synthetic PDFs generated on the fly, and pages come from the recorded
+fixtures. Each run is saved to benchmarks/results/ and compared with the
+previous run (or --compare FILE); metrics that got worse by more than
+--tolerance are reported as regressions.
+
+    python benchmarks/bench_suite.py [--only parse,search] [--quick] [--compare FILE]
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import aijobmatch
+from aijobmatch import (
+    ConcurrentSearchExecutor, HostRateLimiter, JobCardParser, JobIndex, Job, LinkedInJobScraper,
+    PdfTextExtractor, SkillMatcher, SKILL_TAXONOMY_FILE
+)
+from bench_parse import available_backends, load_fixture_pages, measure_throughput
+from stand_in_server import StandInServer
+
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+SEARCH_KEYWORDS = ["Python", "Django", "React", "Docker", "Kubernetes", "SQL", "AWS", "Java"]
+
+def metric(name, value, unit, higher_is_better=False):
+    return {"name": name, "value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+def best_of(func, repeat):
+    """Return the fastest of `repeat` timed calls, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def load_taxonomy():
+    with open(SKILL_TAXONOMY_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)["skills"]
+
+def synthetic_cv_text(paragraphs, seed=0):
+    """CV-like prose mentioning a random sample of taxonomy skills"""
+    rng = random.Random(seed)
+    names = [skill["name"] for skill in load_taxonomy()]
+    filler = "designed delivered maintained improved built services teams customers data platform reliability".split()
+    lines = []
+    for _ in range(paragraphs):
+        words = rng.sample(filler, 6) + rng.sample(names, 4)
+        rng.shuffle(words)
+        lines.append("Worked on " + " ".join(words) + ".")
+    return "\n".join(lines)
+
+def make_synthetic_cv(path, pages):
+    """Write a text PDF of the given number of pages"""
+    doc = aijobmatch.fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (50, 50, -50, -50), synthetic_cv_text(12, seed=number), fontsize=10)
+    doc.save(path)
+    doc.close()
+
+def bench_parse(args):
+    """Cards parsed per second for each installed parser backend"""
+    pages = load_fixture_pages()
+    return [
+        metric(f"parse.{backend}", measure_throughput(JobCardParser(backend), pages, args.seconds), "cards/s", True)
+        for backend in available_backends()
+    ]
+
+def bench_cv_extraction(args):
+    """Cold extraction time (no text cache) for synthetic CVs of increasing size"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in ([1, 8] if args.quick else [1, 8, 64]):
+            path = os.path.join(tmp, f"cv_{pages}.pdf")
+            make_synthetic_cv(path, pages)
+            counter = iter(range(1000))
+            elapsed = best_of(
+                lambda: PdfTextExtractor(cache_dir=os.path.join(tmp, f"cache_{next(counter)}")).extract_text(path),
+                args.repeat
+            )
+            results.append(metric(f"cv_extract.{pages}_pages", elapsed, "s"))
+    return results
+
+def bench_skill_matching(args):
+    """Matcher build and match time as the taxonomy grows, padded with synthetic skills"""
+    taxonomy = load_taxonomy()
+    text = synthetic_cv_text(200)
+    results = []
+    for size in ([len(taxonomy), 2000] if args.quick else [50, len(taxonomy), 2000, 10000]):
+        skills = taxonomy[:size] + [
+            {"name": f"Synthetic Skill {i}", "aliases": [f"synthskill{i}"]} for i in range(max(0, size - len(taxonomy)))
+        ]
+        build = best_of(lambda: SkillMatcher(skills), args.repeat)
+        matcher = SkillMatcher(skills)
+        match = best_of(lambda: matcher.extract(text), args.repeat)
+        results.append(metric(f"skills.build.{size}", build, "s"))
+        results.append(metric(f"skills.match.{size}", match, "s"))
+    return results
+
+def bench_search(args):
+    """End-to-end wall time of a concurrent search against the stand-in server"""
+    jobs_per_query = 50 if args.quick else 100
+    with StandInServer(latency=args.latency, jobs_per_query=jobs_per_query, throttle_every=10) as server:
+        scraper = LinkedInJobScraper(
+            rate_limiter=HostRateLimiter(requests_per_second=100, max_requests_per_second=200),
+            base_url=server.base_url, backoff=0.05
+        )
+        executor = ConcurrentSearchExecutor({"LinkedIn": scraper}, max_workers=8)
+        queries = executor.build_queries(SEARCH_KEYWORDS, [""], ["LinkedIn"])
+        index = JobIndex()
+        returned = 0
+        start = time.perf_counter()
+        for query, jobs in executor.run(queries, max_jobs=jobs_per_query):
+            returned += len(jobs)
+            for job in jobs:
+                index.add(job)
+        elapsed = time.perf_counter() - start
+        requests_made, throttled = server.requests, server.throttled
+    # The stand-in recycles 25 recorded cards, so most postings merge as reposts in the index
+    print(f"  search: {returned} jobs returned, {len(index)} after dedup, {requests_made} requests, {throttled} throttled")
+    return [
+        metric("search.wall_time", elapsed, "s"),
+        metric("search.jobs_per_second", returned / elapsed, "jobs/s", True)
+    ]
+
+def bench_render(args):
+    """Time to insert, sort and draw N rows in the results table; needs a display"""
+    try:
+        root = aijobmatch.tk.Tk()
+    except Exception as e:
+        print(f"  render: skipped ({str(e).splitlines()[0]})")
+        return []
+    results = []
+    try:
+        root.geometry("900x600")
+        for count in ([1000] if args.quick else [1000, 10000]):
+            view = aijobmatch.ResultsView(root)
+            rows = [
+                (Job(str(4000000000 + i), f"Engineer {i}", f"Company {i % 300}", "Remote", f"https://example.com/{i}", "2025-01-01"),
+                 random.random())
+                for i in range(count)
+            ]
+            start = time.perf_counter()
+            view.show(rows)
+            root.update()
+            results.append(metric(f"render.{count}_jobs", time.perf_counter() - start, "s"))
+            view.frame.destroy()
+    finally:
+        root.destroy()
+    return results
+
+BENCHMARKS = {
+    "parse": bench_parse,
+    "cv": bench_cv_extraction,
+    "skills": bench_skill_matching,
+    "search": bench_search,
+    "render": bench_render,
+}
+
+def latest_results_file():
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+    return paths[-1] if paths else None
+
+def compare(metrics, baseline_path, tolerance):
+    """Print the change of each metric against a saved run and return the regressed names"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {m["name"]: m for m in json.load(f)["metrics"]}
+    print(f"\nCompared with {os.path.basename(baseline_path)}:")
+    regressions = []
+    for m in metrics:
+        old = baseline.get(m["name"])
+        if old is None or not old["value"]:
+            continue
+        change = (m["value"] - old["value"]) / old["value"]
+        worse = -change if m["higher_is_better"] else change
+        flag = "REGRESSION" if worse > tolerance else ""
+        if flag:
+            regressions.append(m["name"])
+        print(f"  {m['name']:<28} {old['value']:>12.4g} -> {m['value']:>12.4g} {m['unit']:<8} {change:+7.1%} {flag}")
+    return regressions
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--only", help="Comma-separated benchmarks to run: " + ",".join(BENCHMARKS))
+    arg_parser.add_argument("--quick", action="store_true", help="Smaller inputs for a fast smoke run")
+    arg_parser.add_argument("--seconds", type=float, default=1.0, help="Measurement time per parser backend")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions; the fastest is kept")
+    arg_parser.add_argument("--latency", type=float, default=0.02, help="Stand-in server response latency in seconds")
+    arg_parser.add_argument("--compare", help="Results file to compare with (default: the latest saved run)")
+    arg_parser.add_argument("--tolerance", type=float, default=0.15, help="Relative slowdown reported as a regression")
+    arg_parser.add_argument("--no-save", action="store_true", help="Do not store this run in benchmarks/results")
+    args = arg_parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        arg_parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    baseline_path = args.compare or latest_results_file()
+
+    metrics = []
+    for name in names:
+        print(f"Running {name}...")
+        for m in BENCHMARKS[name](args):
+            print(f"  {m['name']:<28} {m['value']:>12.4g} {m['unit']}")
+            metrics.append(m)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "quick": args.quick,
+                "metrics": metrics
+            }, f, indent=2)
+        print(f"\nResults saved to {path}")
+
+    regressions = compare(metrics, baseline_path, args.tolerance) if baseline_path else []
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
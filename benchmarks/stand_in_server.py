@@ -0,0 +1,164 @@
+"""
+Local stand-in for the LinkedIn guest jobs API
+
+Serves search result pages built from the recorded fixture cards and job detail
+pages, with simulated latency, pagination and 429 throttling, so searches can be
+benchmarked without network access.
+
+    python benchmarks/stand_in_server.py [--port 8765] [--latency 0.05] [--throttle-every 10]
+"""
+import argparse
+import os
+import re
+import sys
+import threading
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_PAGE = os.path.join(FIXTURES_DIR, "linkedin_search_page_full.html")
+
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+DETAIL_PATH = "/jobs-guest/jobs/api/jobPosting/"
+PAGE_SIZE = 25
+
+# Job IDs of the recorded cards, rewritten so every served posting is unique
+CARD_ID_PATTERN = re.compile(r"3812\d{6}")
+
+DETAIL_TEMPLATE = (
+    '<html><body><section class="description">'
+    '<div class="show-more-less-html__markup">'
+    "Job {job_id}. We are looking for an engineer with Python, Django, PostgreSQL, Docker "
+    "and Kubernetes experience. Familiarity with AWS, Terraform, React and CI/CD pipelines "
+    "is a plus. You will design REST APIs, write unit tests and review code."
+    "</div></section></body></html>"
+)
+
+def load_card_templates(path=FIXTURE_PAGE):
+    with open(path, "r", encoding="utf-8") as f:
+        return re.findall(r"<li>.*?</li>", f.read(), re.S)
+
+class StandInServer:
+    """
+    Threaded HTTP server imitating the guest search and job detail endpoints
+    Each keyword has `jobs_per_query` postings served PAGE_SIZE at a time, every
+    response is delayed by `latency` seconds, and every `throttle_every`-th
+    request is answered with 429 and a Retry-After header.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jobs_per_query=100, throttle_every=0, retry_after=0):
+        self.latency = latency
+        self.jobs_per_query = jobs_per_query
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.cards = load_card_templates()
+        self.requests = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _should_throttle(self):
+        with self.lock:
+            self.requests += 1
+            if self.throttle_every and self.requests % self.throttle_every == 0:
+                self.throttled += 1
+                return True
+            return False
+
+    def search_page(self, keyword, start):
+        """Return the cards of one result page; pages past the last posting are empty"""
+        base_id = 4000000000 + (zlib.crc32(keyword.encode("utf-8")) % 100000) * 1000
+        count = max(0, min(PAGE_SIZE, self.jobs_per_query - start))
+        cards = []
+        for offset in range(start, start + count):
+            template = self.cards[offset % len(self.cards)]
+            cards.append(CARD_ID_PATTERN.sub(str(base_id + offset), template))
+        return "\n".join(cards)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._should_throttle():
+                    self._send(429, "", {"Retry-After": str(server.retry_after)})
+                    return
+
+                url = urllib.parse.urlsplit(self.path)
+                if url.path == SEARCH_PATH:
+                    query = urllib.parse.parse_qs(url.query)
+                    keyword = query.get("keywords", [""])[0]
+                    start = int(query.get("start", ["0"])[0])
+                    self._send(200, server.search_page(keyword, start))
+                elif url.path.startswith(DETAIL_PATH):
+                    self._send(200, DETAIL_TEMPLATE.format(job_id=url.path[len(DETAIL_PATH):]))
+                else:
+                    self._send(404, "")
+
+            def _send(self, status, body, headers=None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every response")
+    arg_parser.add_argument("--jobs-per-query", type=int, default=100)
+    arg_parser.add_argument("--throttle-every", type=int, default=10, help="Answer every Nth request with 429 (0 disables)")
+    arg_parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 responses")
+    args = arg_parser.parse_args(argv)
+
+    server = StandInServer(
+        port=args.port, latency=args.latency, jobs_per_query=args.jobs_per_query,
+        throttle_every=args.throttle_every, retry_after=args.retry_after
+    )
+    print(f"Serving the LinkedIn stand-in on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+FIXTURES_DIR = os.path.join(os.path.dirname(TESTS_DIR), "benchmarks", "fixtures")
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+import requests
+
+from aijobmatch import JobStore, LinkedInJobScraper
+from conftest import FIXTURES_DIR
+
+def fixture_response(name="linkedin_search_page_last.html"):
+    """A result page that every keyword gets back, like overlapping real searches"""
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        response = requests.Response()
+        response._content = f.read()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    return response
+
+@pytest.fixture
+def job_store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+@pytest.fixture
+def scraper(job_store):
+    scraper = LinkedInJobScraper(job_store=job_store)
+    scraper.fetched = []
+
+    def fetch_page(url, cancel=None):
+        scraper.fetched.append(url)
+        return fixture_response()
+
+    scraper._fetch_page = fetch_page
+    return scraper
+
+def search(scraper, job_store, keyword, location=""):
+    jobs = scraper.search_jobs(keyword, location=location, max_jobs=50,
+                               on_page=lambda page: job_store.add(page, location=location), incremental=True)
+    job_store.record_query(keyword, location)
+    return jobs
+
+def test_jobs_stored_by_another_query_do_not_stop_a_new_query(scraper, job_store):
+    python_jobs = search(scraper, job_store, "Python")
+    assert python_jobs
+
+    django_jobs = search(scraper, job_store, "Django")
+    assert [job["job_id"] for job in django_jobs] == [job["job_id"] for job in python_jobs]
+
+def test_first_run_of_a_query_is_not_sorted_incrementally(scraper, job_store):
+    search(scraper, job_store, "Python")
+    assert "sortBy=DD" not in scraper.fetched[0]
+
+def test_repeated_query_stops_at_its_stored_jobs(scraper, job_store):
+    search(scraper, job_store, "Python")
+    assert search(scraper, job_store, "Python") == []
+    assert "sortBy=DD" in scraper.fetched[-1]
+
+def test_known_ids_is_scoped_to_keyword_and_location(job_store, scraper):
+    jobs = search(scraper, job_store, "Python", location="Paris")
+    job_ids = [job["job_id"] for job in jobs]
+
+    assert job_store.known_ids(job_ids, ["Python"], "Paris") == set(job_ids)
+    assert job_store.known_ids(job_ids, ["Python"], "Berlin") == set()
+    assert job_store.known_ids(job_ids, ["Django", "Flask"], "Paris") == set()
+    assert search(scraper, job_store, "Python", location="Berlin")
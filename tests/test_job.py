@@ -0,0 +1,6 @@
+from aijobmatch import Job
+
+def test_jobs_with_null_fields_load():
+    job = Job.from_dict({"job_id": None, "title": None, "company": None, "location": None, "url": None,
+                         "date_posted": None, "scrape_time": "2025-01-01T00:00:00"})
+    assert (job["job_id"], job["title"], job["url"], job["date_posted"]) == ("", "", "", "")
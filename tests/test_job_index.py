@@ -0,0 +1,32 @@
+import pytest
+
+from aijobmatch import Job, JobIndex
+
+def make_job(job_id, title, keyword="Python", company="Acme", location="Paris"):
+    return Job(job_id, title, company, location, f"https://example.com/{job_id}", "2025-01-01", keyword=keyword)
+
+def test_the_same_record_added_again_is_not_a_duplicate():
+    index = JobIndex()
+    job = make_job("4000000001", "Python Developer")
+    index.add(job)
+    
+    assert index.add(job) == (job, False, [])
+    assert index.duplicates == 0
+
+def test_reposts_merge_their_keywords():
+    index = JobIndex()
+    record, _, _ = index.add(make_job("4000000001", "Python Developer"))
+    
+    assert index.add(make_job("4000000002", "Python  developer", keyword="Django")) == (record, False, ["Django"])
+    assert record["keywords"] == ["Python", "Django"]
+
+@pytest.mark.parametrize("title, other", [
+    ("Senior Python Developer", "Junior Python Developer"),
+    ("Software Engineer II", "Software Engineer III"),
+    ("Data Engineer", "Data Engineer - Contract"),
+])
+def test_distinct_postings_are_kept(title, other):
+    index = JobIndex()
+    index.add(make_job("4000000001", title))
+    index.add(make_job("4000000002", other))
+    assert len(index) == 2
@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from aijobmatch import CachedResponse, Job, JobDetailFetcher, JobStore
+
+def make_job(job_id, title, description=None):
+    return Job(job_id, title, "Acme", "Paris", f"https://example.com/{job_id}", "2025-01-01",
+               keyword="Python", description=description)
+
+@pytest.fixture
+def job_store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    if not store.has_fts:
+        pytest.skip("SQLite was built without FTS5")
+    return store
+
+def test_updating_a_job_replaces_its_full_text_row(job_store):
+    job_store.add([make_job("1", "Python Developer", "Django and PostgreSQL")])
+    job_store.add([make_job("1", "Senior Python Developer")])
+    
+    assert [job["title"] for job in job_store.query(text="Senior")] == ["Senior Python Developer"]
+    # The stored description is kept and stays searchable
+    assert [job["job_id"] for job in job_store.query(text="PostgreSQL")] == ["1"]
+    assert job_store.conn.execute("SELECT COUNT(*) FROM jobs_fts").fetchone()[0] == 1
+
+def test_stores_indexed_by_job_id_are_reindexed(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    JobStore(path).add([make_job("1", "Python Developer"), make_job("2", "Rust Engineer")])
+    conn = sqlite3.connect(path)
+    with conn:
+        # Rows as older versions wrote them, numbered independently of the jobs table
+        conn.execute("DELETE FROM jobs_fts")
+        conn.execute("INSERT INTO jobs_fts (job_id, title, company, description) VALUES ('2', 'Rust Engineer', 'Acme', '')")
+        conn.execute("INSERT INTO jobs_fts (job_id, title, company, description) VALUES ('1', 'Python Developer', 'Acme', '')")
+        conn.execute("PRAGMA user_version = 0")
+    conn.close()
+    
+    store = JobStore(path)
+    assert [job["job_id"] for job in store.query(text="Rust")] == ["2"]
+
+class DetailScraper:
+    """Answers job detail requests with a fixed description and counts them"""
+    
+    base_url = "https://www.linkedin.com"
+    
+    def __init__(self):
+        self.fetched = []
+    
+    def _fetch_page(self, url, cancel=None):
+        self.fetched.append(url)
+        return CachedResponse(200, '<div class="show-more-less-html__markup">Kubernetes and Terraform</div>')
+
+def test_fetched_descriptions_are_stored_and_reused(job_store):
+    jobs = [make_job("4000000001", "Platform Engineer"), make_job("4000000002", "SRE")]
+    job_store.add(jobs)
+    scraper = DetailScraper()
+    
+    fetched = dict(JobDetailFetcher(scraper, job_store=job_store).fetch(jobs))
+    assert list(fetched.values()) == ["Kubernetes and Terraform"] * 2
+    assert {job["job_id"] for job in job_store.query(text="Terraform")} == {"4000000001", "4000000002"}
+    
+    # A later session reuses the stored descriptions instead of fetching them again
+    preloaded = job_store.query(keyword="Python")
+    assert [job["description"] for job in preloaded] == ["Kubernetes and Terraform"] * 2
+    rescraped = [make_job("4000000001", "Platform Engineer")]
+    assert dict(JobDetailFetcher(scraper, job_store=job_store).fetch(preloaded + rescraped))
+    assert len(scraper.fetched) == 2
@@ -0,0 +1,41 @@
+import pytest
+
+from aijobmatch import Job, JobRanker, QueryPlanner, load_skill_matcher, ranking_available
+
+CV_SKILLS = ["Django", "Flask", "FastAPI"]
+COMBINED_QUERY = '"Django" OR "Flask" OR "FastAPI"'
+
+def make_jobs(keyword):
+    # The search matched the two generic titles on descriptions we have not fetched
+    return [
+        Job("4000000001", "Senior Django Developer", "Acme", "Paris", "https://example.com/1", "2025-01-03", keyword=keyword),
+        Job("4000000002", "Marketing Manager", "Globex", "Paris", "https://example.com/2", "2025-01-02", keyword=keyword),
+        Job("4000000003", "Backend Engineer", "Initech", "Paris", "https://example.com/3", "2025-01-01", keyword=keyword),
+    ]
+
+@pytest.fixture
+def planner():
+    return QueryPlanner(load_skill_matcher())
+
+def rank(jobs):
+    ranker = JobRanker(load_skill_matcher())
+    ranker.add(jobs)
+    return [(job["title"], score) for job, score in ranker.rank(CV_SKILLS)]
+
+def test_fallback_jobs_are_filed_under_every_skill(planner):
+    jobs = planner.attribute(make_jobs(COMBINED_QUERY))
+
+    assert jobs[0]["keyword"] == "Django"
+    assert jobs[0]["keywords"] == ["Django"]
+    assert jobs[1]["keywords"] == CV_SKILLS
+    assert QueryPlanner.confirmed_keywords(jobs[0]) == ["Django"]
+    assert QueryPlanner.confirmed_keywords(jobs[1]) == []
+
+@pytest.mark.skipif(not ranking_available(), reason="ranking needs numpy and scipy")
+def test_planned_search_ranks_like_single_skill_searches(planner):
+    planned = rank(planner.attribute(make_jobs(COMBINED_QUERY)))
+    unplanned = rank(make_jobs("Django"))
+
+    assert [title for title, _ in planned] == [title for title, _ in unplanned]
+    assert planned[0][0] == "Senior Django Developer"
+    assert planned[0][1] > max(score for _, score in planned[1:])
@@ -0,0 +1,38 @@
+import threading
+import time
+
+from aijobmatch import ConcurrentSearchExecutor, HostRateLimiter, Job, JobSource
+
+class ThrottledBoard(JobSource):
+    """Delivers one page, then waits on a rate limit far beyond the search deadline"""
+    
+    name = "Throttled"
+    
+    def __init__(self, **kwargs):
+        super().__init__(rate_limiter=HostRateLimiter(requests_per_second=0.01), **kwargs)
+        self.finished = threading.Event()
+    
+    def search_jobs(self, keyword, location="", max_jobs=10, on_page=None, incremental=False, cancel=None):
+        jobs = []
+        try:
+            for page in range(max_jobs):
+                self.rate_limiter.acquire("https://jobs.example.com/", cancel)
+                page_jobs = [Job(f"{page}", f"{keyword} Developer", "Acme", location, f"https://jobs.example.com/{page}")]
+                jobs.extend(page_jobs)
+                if on_page:
+                    on_page(page_jobs)
+        finally:
+            self.finished.set()
+        return jobs
+
+def test_deadline_cancels_searches_waiting_on_the_rate_limiter():
+    source = ThrottledBoard()
+    executor = ConcurrentSearchExecutor({"Throttled": source})
+    
+    start = time.monotonic()
+    results = list(executor.run([("Throttled", "Python", "")], max_jobs=5, deadline=0.3))
+    
+    assert executor.deadline_exceeded
+    assert [len(jobs) for _, jobs in results] == [1]
+    assert source.finished.wait(2)
+    assert time.monotonic() - start < 2
@@ -0,0 +1,32 @@
+import pytest
+
+from aijobmatch import load_skill_matcher
+
+@pytest.fixture(scope="module")
+def matcher():
+    return load_skill_matcher()
+
+@pytest.mark.parametrize("text", [
+    "Led R&D for a retail chain", "Grade C certificate", "Reported to C-level executives", "Less is more",
+    "Tidying that will Spark joy", "The office is a Hive of activity", "Bring a Flask of water",
+    "Express delivery available", "Swift delivery guaranteed", "Grew up in the Rust-belt",
+    "Celebrating our Ruby anniversary",
+])
+def test_everyday_words_are_not_skills(matcher, text):
+    assert matcher.extract(text) == {}
+
+@pytest.mark.parametrize("text, skills", [
+    ("Python, Flask and PostgreSQL", ["Python", "Flask", "PostgreSQL"]),
+    ("iOS apps in Swift and Objective-C", ["iOS", "Swift", "Objective-C"]),
+    ("Styles in Sass or Less", ["Sass", "Less"]),
+    ("Hadoop, Apache Spark, HiveQL", ["Hadoop", "Apache Spark", "Apache Hive"]),
+])
+def test_ambiguous_skills_count_next_to_other_skills(matcher, text, skills):
+    assert list(matcher.extract(text)) == skills
+
+def test_context_is_the_nearest_skill_on_either_side(matcher):
+    far = " filler" * 10
+    assert list(matcher.extract(f"Swift{far} Python")) == ["Python"]
+    assert list(matcher.extract(f"Python{far} Swift, Rust")) == ["Python"]
+    assert list(matcher.extract(f"Python{far} Swift and Java")) == ["Python", "Swift", "Java"]
+    assert matcher.extract("Python, Swift; " * 2000)["Swift"]["count"] == 2000
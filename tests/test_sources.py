@@ -0,0 +1,57 @@
+import pytest
+
+import aijobmatch
+from aijobmatch import (
+    HostRateLimiter, JobCardParser, JobSource, JobStore, ResponseCache, create_http_session, create_sources
+)
+
+class KwargsBoard(JobSource):
+    name = "Kwargs"
+    
+    def __init__(self, base_url="https://jobs.example.com", **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+    
+    def search_jobs(self, keyword, location="", max_jobs=10, on_page=None, incremental=False, cancel=None):
+        return []
+
+def test_create_sources_passes_every_argument_to_kwargs_constructors(monkeypatch):
+    monkeypatch.setitem(aijobmatch.JOB_SOURCES, "Kwargs", KwargsBoard)
+    rate_limiter = HostRateLimiter()
+    
+    sources = create_sources(["Kwargs", "LinkedIn"], rate_limiter=rate_limiter, backoff=0.5, base_url="http://127.0.0.1")
+    
+    assert sources["Kwargs"].rate_limiter is rate_limiter
+    assert sources["Kwargs"].backoff == 0.5
+    assert sources["Kwargs"].base_url == "http://127.0.0.1"
+    assert sources["LinkedIn"].base_url == "http://127.0.0.1"
+
+def test_kwargs_sources_accept_the_gui_and_batch_options(monkeypatch, tmp_path):
+    monkeypatch.setitem(aijobmatch.JOB_SOURCES, "Kwargs", KwargsBoard)
+    rate_limiter = HostRateLimiter()
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    
+    # The options JobMatchAgent.__init__ passes
+    gui_sources = create_sources(
+        delay_between_requests=1.5, rate_limiter=rate_limiter, cache=cache,
+        session=create_http_session(), job_store=JobStore(str(tmp_path / "jobs.db"))
+    )
+    # The options run_batch passes
+    batch_sources = create_sources(
+        list(aijobmatch.JOB_SOURCES), rate_limiter=rate_limiter, cache=cache, session=create_http_session(),
+        parser=JobCardParser(), cpu_pool=None
+    )
+    
+    assert gui_sources["Kwargs"].cache is cache
+    assert batch_sources["Kwargs"].rate_limiter is rate_limiter
+
+def test_create_sources_drops_arguments_a_source_does_not_accept():
+    sources = create_sources(["Indeed"], backoff=0.5, base_url="http://127.0.0.1")
+    assert sources["Indeed"].backoff == 0.5
+
+def test_sources_must_implement_search_jobs():
+    class Incomplete(JobSource):
+        name = "Incomplete"
+    
+    with pytest.raises(TypeError):
+        Incomplete()
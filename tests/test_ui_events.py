@@ -0,0 +1,44 @@
+import queue
+from types import SimpleNamespace
+
+from aijobmatch import JobMatchAgent
+
+class Var:
+    def __init__(self):
+        self.value = None
+    
+    def set(self, value):
+        self.value = value
+
+class FailingView:
+    jobs = []
+    
+    def append(self, rows):
+        raise RuntimeError("render failed")
+
+def make_agent():
+    scheduled = []
+    agent = SimpleNamespace(
+        ui_events=queue.Queue(), UI_DRAIN_BUDGET=1.0, UI_POLL_MS=50, results_view=FailingView(),
+        job_count_var=Var(), status_var=Var(), progress_var=Var(),
+        root=SimpleNamespace(after=lambda ms, func: scheduled.append(func))
+    )
+    agent.drain_ui_events = lambda: JobMatchAgent.drain_ui_events(agent)
+    return agent, scheduled
+
+def test_failing_events_do_not_stop_the_ui_poll():
+    agent, scheduled = make_agent()
+    finished = []
+    
+    def fail():
+        raise ValueError("broken callback")
+    
+    agent.ui_events.put(("jobs", [("job", 0.0)]))
+    agent.ui_events.put(("call", (fail,)))
+    agent.ui_events.put(("call", (finished.append, True)))
+    agent.ui_events.put(("progress", 100))
+    agent.drain_ui_events()
+    
+    assert finished == [True]
+    assert agent.progress_var.value == 100
+    assert len(scheduled) == 1